@@ -8,16 +8,518 @@ by extracting direct audio URLs from the webpage HTML.
 
 import os
 import re
+import logging
+import base64
+import binascii
 import sys
-import time
+import queue
 import random
+import shutil
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional, Tuple, List
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlsplit
 
 import requests
-from bs4 import BeautifulSoup
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.cookies import get_cookie_header
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 from tqdm import tqdm
+from tqdm.contrib.logging import logging_redirect_tqdm
+
+try:
+    from bs4.filter import ElementFilter
+except ImportError:  # beautifulsoup4 < 4.13 parses the whole page instead
+    ElementFilter = None
+
+logger = logging.getLogger(__name__)
+
+# Only advertise content codings urllib3 can actually decode here ("br" needs
+# brotli, "zstd" needs zstandard), formatted the way browsers send them
+_ACCEPT_ENCODING = ', '.join(urllib3.util.request.ACCEPT_ENCODING.split(','))
+
+# Multiple User-Agents to rotate
+_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/119.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+)
+
+# Default session headers (the User-Agent is picked per instance)
+_SESSION_HEADERS = MappingProxyType({
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7,ja;q=0.6',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+})
+
+# Base of get_random_headers() (the User-Agent is picked per call)
+_RANDOM_HEADERS = MappingProxyType({
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Referer': 'https://japaneseasmr.com/',
+})
+
+# Header profiles for audio file requests, rotated when the server answers 403/429
+_DOWNLOAD_HEADER_PROFILES = (
+    # Chrome on Windows
+    MappingProxyType({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': '*/*',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': _ACCEPT_ENCODING,
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Sec-Fetch-Dest': 'audio',
+        'Sec-Fetch-Mode': 'no-cors',
+        'Sec-Fetch-Site': 'cross-site',
+        'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+        'sec-ch-ua-mobile': '?0',
+        'sec-ch-ua-platform': '"Windows"'
+    }),
+    # Firefox on Windows
+    MappingProxyType({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0',
+        'Accept': 'audio/webm,audio/ogg,audio/wav,audio/*;q=0.9,application/ogg;q=0.7,video/*;q=0.6,*/*;q=0.5',
+        'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+        'Accept-Encoding': _ACCEPT_ENCODING,
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Sec-Fetch-Dest': 'audio',
+        'Sec-Fetch-Mode': 'no-cors',
+        'Sec-Fetch-Site': 'cross-site',
+    }),
+    # Chrome on macOS
+    MappingProxyType({
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': '*/*',
+        'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+        'Accept-Encoding': _ACCEPT_ENCODING,
+        'Connection': 'keep-alive',
+        'Sec-Fetch-Dest': 'audio',
+        'Sec-Fetch-Mode': 'no-cors',
+        'Sec-Fetch-Site': 'cross-site',
+        'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+        'sec-ch-ua-mobile': '?0',
+        'sec-ch-ua-platform': '"macOS"'
+    }),
+)
+
+# Page request headers of the bypass methods
+# Method 2: iPhone Safari
+_MOBILE_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Referer': 'https://japaneseasmr.com/',
+    'DNT': '1',
+    'Upgrade-Insecure-Requests': '1',
+})
+
+# Method 3: Firefox on Windows
+_FIREFOX_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Referer': 'https://japaneseasmr.com/',
+})
+
+# Method 4: bare minimum a client sends
+_MINIMAL_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': '*/*',
+    'Connection': 'keep-alive',
+})
+
+# Method 5: Chrome on macOS in a fresh session
+_MAC_CHROME_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Cache-Control': 'max-age=0',
+    'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+    'sec-ch-ua-mobile': '?0',
+    'sec-ch-ua-platform': '"macOS"',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+})
+
+# Method 6: Linux Chrome arriving from a search engine
+_PROXY_STYLE_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9,ko;q=0.8',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'Cache-Control': 'no-cache',
+    'Connection': 'keep-alive',
+    'DNT': '1',
+    'Pragma': 'no-cache',
+    'Referer': 'https://google.com/',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'cross-site',
+    'Sec-Fetch-User': '?1',
+    'Upgrade-Insecure-Requests': '1',
+})
+
+# Method 7: homepage visit, then a full Chrome navigation (Referer added per page)
+_STEALTH_WARMUP_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9',
+    'Connection': 'keep-alive',
+})
+
+# Method 7 page request (Referer is the page's own origin)
+_STEALTH_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'Cache-Control': 'max-age=0',
+    'Connection': 'keep-alive',
+    'DNT': '1',
+    'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+    'sec-ch-ua-mobile': '?0',
+    'sec-ch-ua-platform': '"Windows"',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'same-origin',
+    'Sec-Fetch-User': '?1',
+    'Upgrade-Insecure-Requests': '1',
+})
+
+# establish_session() first visit
+_ESTABLISH_SESSION_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Referer': 'https://japaneseasmr.com/',
+})
+
+# download_file_alternative() session defaults (Firefox audio element)
+_ALTERNATIVE_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0',
+    'Accept': 'audio/webm,audio/ogg,audio/wav,audio/*;q=0.9,application/ogg;q=0.7,video/*;q=0.6,*/*;q=0.5',
+    'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Sec-Fetch-Dest': 'audio',
+    'Sec-Fetch-Mode': 'no-cors',
+    'Sec-Fetch-Site': 'cross-site',
+    'Pragma': 'no-cache',
+    'Cache-Control': 'no-cache'
+})
+
+# download_file_browser_sim() file request (Host, Range and Referer added per call)
+_BROWSER_SIM_HEADERS = MappingProxyType({
+    'Accept': '*/*',
+    'Accept-Encoding': 'identity;q=1, *;q=0',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Cache-Control': 'no-cache',
+    'Connection': 'keep-alive',
+    'DNT': '1',
+    'Pragma': 'no-cache',
+    'Sec-Fetch-Dest': 'audio',
+    'Sec-Fetch-Mode': 'no-cors',
+    'Sec-Fetch-Site': 'cross-site',
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+})
+
+# Concurrency for the HEAD/GET probes used when guessing audio file locations
+_PROBE_WORKERS = 16
+_PROBES_PER_HOST = 8
+
+# Delay between the starts of successive racing bypass methods, so the site
+# doesn't see seven requests for the same page at once. It is as long as the
+# longest random delay each method adds itself (0.2-0.5s), so the methods
+# still go out in order and at least 0.2s apart.
+_BYPASS_STAGGER = 0.5
+
+# Audio files of one page downloaded at the same time
+_DOWNLOAD_WORKERS = 4
+
+# Block size used when copying a download body to disk, and how many blocks
+# may wait for the writer thread (bounds memory to ~8 MiB per download)
+_COPY_BUFFER_SIZE = 1 << 20
+_WRITE_QUEUE_BLOCKS = 8
+_POOL_MAXSIZE = 32
+
+# Downloads are written to "<file>.part" and renamed into place once complete,
+# so an interrupted transfer never looks like a finished file
+_PART_SUFFIX = '.part'
+
+# Files larger than this are fetched as several byte ranges at once, since the
+# CDNs cap the throughput of a single connection
+_RANGED_MIN_SIZE = 20 * 1024 * 1024
+_RANGED_PARTS = 4
+
+# Number of pages kept for conditional (If-None-Match / If-Modified-Since) requests
+_PAGE_CACHE_SIZE = 32
+
+# Quoted audio file URLs in inline JavaScript (Method 3). Every quoted
+# string ending in .mp3/.m4a is captured, which also covers the keyed
+# url/src/audioUrl forms, so a single scan per script is enough.
+_AUDIO_URL_PATTERN = re.compile(r'["\'](?P<quoted>[^"\']*\.(?:mp3|m4a))["\']', re.IGNORECASE)
+
+# Assignments that might reveal actual file URLs on blob URL sites (Method 6.5)
+_JS_AUDIO_URL_PATTERN = re.compile(
+    r'(?:audioUrl|src|file|audio)["\s]*:["\s]*["\'](?P<keyed>[^"\']*\.(?:mp3|m4a))["\']'
+    r'|url["\s]*=["\s]*["\'](?P<assigned>[^"\']*\.(?:mp3|m4a))["\']'
+    # Direct file references in variable assignments
+    r'|(?:var|let|const)\s+\w+\s*=\s*["\'](?P<declared>[^"\']*\.(?:mp3|m4a))["\']'
+    # WordPress media library paths
+    r'|(?P<wordpress>wp-content/uploads/[^"\']*\.(?:mp3|m4a))',
+    re.IGNORECASE,
+)
+
+_BASE64_PATTERN = re.compile(r'["\']([A-Za-z0-9+/]{20,}={0,2})["\']')
+# "http" base64-encoded at each of the three possible byte alignments. Any
+# payload that decodes to an absolute URL must contain one of these.
+_BASE64_HTTP_MARKERS = ('aHR0c', 'h0dH', 'odHRw')
+_ABSOLUTE_AUDIO_URL_PATTERN = re.compile(r'https?://[^\s"\'<>]+\.(?:mp3|m4a)')
+
+# Element attributes that commonly carry audio file URLs (Method 5)
+_DATA_URL_ATTRS = ('data-src', 'data-url', 'data-file', 'data-audio-url')
+_CONTAINER_TAGS = ('div', 'section', 'article')
+_CONTAINER_KEYWORDS = ('audio', 'player', 'media', 'download')
+
+# Characters not allowed in Windows filenames, and runs of whitespace (titles)
+_FILENAME_BAD_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# File extensions reported as-is as the audio format
+_AUDIO_EXTENSIONS = ('mp3', 'm4a', 'wav', 'flac')
+
+
+if ElementFilter is not None:
+    class _AudioElementFilter(ElementFilter):
+        """Only build the parts of a page that the audio URL detection inspects."""
+        
+        def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+            attrs = attrs or {}
+            if name in ('video', 'audio', 'script', 'form'):
+                return True
+            if name == 'input':
+                return attrs.get('type') == 'hidden'
+            if name == 'a':
+                return 'href' in attrs
+            if name in _CONTAINER_TAGS:
+                classes = attrs.get('class') or ''
+                if not isinstance(classes, str):
+                    classes = ' '.join(classes)
+                if any(keyword in classes.lower() for keyword in _CONTAINER_KEYWORDS):
+                    return True
+            return any(attr in attrs for attr in ('data-audio',) + _DATA_URL_ATTRS)
+        
+        def allow_string_creation(self, string) -> bool:
+            # Text outside the kept elements is never inspected
+            return False
+    
+    _AUDIO_ELEMENTS = _AudioElementFilter()
+else:
+    _AUDIO_ELEMENTS = None
+
+
+def _parse_html(markup: bytes, parse_only=None) -> BeautifulSoup:
+    """Parse HTML with the fast lxml parser, falling back to html.parser."""
+    try:
+        return BeautifulSoup(markup, 'lxml', parse_only=parse_only)
+    except FeatureNotFound:
+        return BeautifulSoup(markup, 'html.parser', parse_only=parse_only)
+
+
+def _origin(url: str) -> str:
+    """Return the scheme://host[:port] origin of a URL."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _normalize_url(url: str) -> str:
+    """Normalize a URL for duplicate detection (lowercase scheme/host, no fragment)."""
+    parts = urlsplit(url)
+    return parts._replace(scheme=parts.scheme.lower(), netloc=parts.netloc.lower(),
+                          fragment='').geturl()
+
+
+def _collect_elements(soup: BeautifulSoup) -> dict:
+    """
+    Walk the parsed page once and group the elements inspected for audio URLs.
+    
+    Args:
+        soup: Parsed webpage
+        
+    Returns:
+        Dict mapping a category (tag name, data attribute, 'container',
+        'hidden_input' or 'link') to its elements in document order
+    """
+    found = {key: [] for key in ('video', 'audio', 'script', 'form', 'container',
+                                 'hidden_input', 'link', 'data-audio') + _DATA_URL_ATTRS}
+    
+    for element in soup.find_all(True):
+        name = element.name
+        attrs = element.attrs
+        
+        if name in ('video', 'audio', 'script', 'form'):
+            found[name].append(element)
+        elif name in _CONTAINER_TAGS:
+            classes = attrs.get('class') or ()
+            if any(keyword in cls.lower() for cls in classes for keyword in _CONTAINER_KEYWORDS):
+                found['container'].append(element)
+        elif name == 'input':
+            if attrs.get('type') == 'hidden':
+                found['hidden_input'].append(element)
+        elif name == 'a':
+            if 'href' in attrs:
+                found['link'].append(element)
+        
+        for attr in ('data-audio',) + _DATA_URL_ATTRS:
+            if attr in attrs:
+                found[attr].append(element)
+    
+    return found
+
+
+class _ProgressReader:
+    """File-like wrapper that reports every block read to a progress callback."""
+    
+    def __init__(self, raw, update, stop_event: Optional[threading.Event] = None) -> None:
+        self._raw = raw
+        self._update = update
+        self._stop_event = stop_event
+    
+    def read(self, size: int = -1) -> bytes:
+        # Reading nothing once a stop is requested ends the copy early
+        if self._stop_event is not None and self._stop_event.is_set():
+            return b''
+        data = self._raw.read(size)
+        if data:
+            self._update(len(data))
+        return data
+
+
+class _QueuedWriter:
+    """File-like wrapper that writes blocks to disk on a background thread."""
+    
+    def __init__(self, file) -> None:
+        self._file = file
+        self._queue = queue.Queue(maxsize=_WRITE_QUEUE_BLOCKS)
+        self._error = None
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+    
+    def _drain(self) -> None:
+        while True:
+            block = self._queue.get()
+            if block is None:
+                return
+            # After a failed write keep draining so the producer never blocks
+            if self._error is None:
+                try:
+                    self._file.write(block)
+                except Exception as e:
+                    self._error = e
+    
+    def write(self, block: bytes) -> int:
+        if self._error is not None:
+            raise self._error
+        self._queue.put(block)
+        return len(block)
+    
+    def close(self) -> None:
+        """Wait for all queued blocks to be written, re-raising any write error."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+
+def _partial_size(filename: str) -> int:
+    """Return how many bytes of a file an earlier attempt already wrote (0 if none)."""
+    try:
+        return os.path.getsize(filename)
+    except OSError:
+        return 0
+
+
+def _preallocate(file, size: int) -> None:
+    """Reserve the full size of a new download file before writing it."""
+    if hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(file.fileno(), 0, size)
+            return
+        except OSError:
+            pass
+    # Elsewhere (e.g. Windows) setting the end of file makes the filesystem allocate it
+    file.truncate(size)
+
+
+def stream_to_file(response: requests.Response, file, progress,
+                   stop_event: Optional[threading.Event] = None, reserve: int = 0) -> None:
+    """
+    Copy a streamed response body to a file in large blocks, reporting progress.
+    
+    Args:
+        response: Streaming response whose body is copied
+        file: File opened for binary writing, positioned where the body goes
+        progress: Callback receiving the size of every block read
+        stop_event: Optional event that ends the copy early once set
+        reserve: Size to preallocate for a new, empty file (0 to skip)
+        
+    Raises:
+        ValueError: If stop_event was set before the body was complete (the bytes
+            written so far stay in the file)
+    """
+    if reserve > 0:
+        _preallocate(file, reserve)
+    
+    # Let urllib3 undo any gzip/deflate/br content coding while reading
+    response.raw.decode_content = True
+    
+    # Disk writes happen on a separate thread so they overlap with receiving the next block
+    writer = _QueuedWriter(file)
+    try:
+        shutil.copyfileobj(_ProgressReader(response.raw, progress, stop_event), writer, _COPY_BUFFER_SIZE)
+    finally:
+        try:
+            writer.close()
+        finally:
+            # Drop any preallocated tail, so the file holds exactly the bytes written
+            file.truncate(file.tell())
+    
+    if stop_event is not None and stop_event.is_set():
+        raise ValueError("Download stopped by user")
 
 
 class AudioDownloader:
@@ -27,40 +529,105 @@ class AudioDownloader:
         """Initialize the downloader with session and headers."""
         self.session = requests.Session()
         
+        # Larger connection pool so concurrent probes reuse keep-alive sockets,
+        # with a couple of quick retries for transient server errors
+        retries = Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            raise_on_status=False,
+        )
+        self._adapter = HTTPAdapter(pool_connections=_POOL_MAXSIZE, pool_maxsize=_POOL_MAXSIZE,
+                                    max_retries=retries)
+        self.session.mount('https://', self._adapter)
+        self.session.mount('http://', self._adapter)
+        
+        # Bare urllib3 pool for the many HEAD probes, skipping requests' per-call overhead.
+        # One TLS context (with the same CA bundle requests uses) is shared by all its
+        # connections instead of urllib3 building and loading a new one per connection.
+        ssl_context = urllib3.util.ssl_.create_urllib3_context()
+        ssl_context.load_verify_locations(requests.certs.where())
+        self._pool = urllib3.PoolManager(num_pools=4, maxsize=_POOL_MAXSIZE, ssl_context=ssl_context)
+        
+        # (scheme, netloc) -> proxy URL requests would use for that host (None for direct),
+        # since the bare pool above knows nothing about HTTP(S)_PROXY / NO_PROXY
+        self._proxy_by_host = {}
+        
+        # page_url -> (etag, last_modified, content) for conditional page requests
+        self._page_cache = {}
+        # Pages are analyzed on several threads; held while the cache is modified
+        self._page_cache_lock = threading.Lock()
+        
+        # netloc -> semaphore bounding concurrent HEAD probes against that host
+        self._host_slots = {}
+        
+        # Hosts establish_session() already visited; their cookies stay in self.session
+        self._primed_hosts = set()
+        
+        # Set by callers (e.g. the GUI stop button) to interrupt delays immediately
+        self.stop_event = threading.Event()
+        
         # Multiple User-Agents to rotate
-        self.user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/119.0',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        ]
-        
-        self.session.headers.update({
-            'User-Agent': random.choice(self.user_agents),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7,ja;q=0.6',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0',
-        })
+        self.user_agents = _USER_AGENTS
+        
+        self.session.headers.update(_SESSION_HEADERS)
+        self.session.headers['User-Agent'] = random.choice(self.user_agents)
+        
+    def _new_session(self) -> requests.Session:
+        """
+        Create a session with its own cookies and headers that shares the connection pool.
+        
+        The returned session must not be closed, as that would close the shared adapter.
+        """
+        session = requests.Session()
+        session.mount('https://', self._adapter)
+        session.mount('http://', self._adapter)
+        return session
         
     def get_random_headers(self) -> dict:
         """Get randomized headers to avoid detection."""
-        return {
-            'User-Agent': random.choice(self.user_agents),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Referer': 'https://japaneseasmr.com/',
-        }
+        # Fresh dict each call: callers add Range/Referer/Cookie entries to it
+        headers = dict(_RANDOM_HEADERS)
+        headers['User-Agent'] = random.choice(self.user_agents)
+        return headers
+        
+    @staticmethod
+    def _conditional_headers(cached: Optional[tuple]) -> dict:
+        """Build If-None-Match / If-Modified-Since headers from a page's _page_cache entry."""
+        if not cached:
+            return {}
+        
+        etag, last_modified, _ = cached
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+        
+    def _remember_page(self, page_url: str, response: requests.Response, content: bytes) -> None:
+        """Store a fetched page with its validators for later conditional requests."""
+        entry = (
+            response.headers.get('ETag'),
+            response.headers.get('Last-Modified'),
+            content,
+        )
+        with self._page_cache_lock:
+            self._page_cache.pop(page_url, None)
+            if len(self._page_cache) >= _PAGE_CACHE_SIZE:
+                # Drop the oldest entry (dicts keep insertion order)
+                self._page_cache.pop(next(iter(self._page_cache)), None)
+            self._page_cache[page_url] = entry
+        
+    @staticmethod
+    def _classify(url: str) -> str:
+        """Determine the audio format of a URL from its extension, defaulting to m4a."""
+        lowered = url.lower()
+        extension = urlsplit(lowered).path.rpartition('.')[2]
+        if extension in _AUDIO_EXTENSIONS:
+            return extension
+        return 'mp3' if '.mp3' in lowered else 'm4a'
         
     def extract_audio_urls(self, page_url: str, stop_callback=None) -> List[Tuple[str, str]]:
         """
@@ -77,28 +644,49 @@ class AudioDownloader:
             requests.RequestException: If unable to fetch the webpage
             ValueError: If no audio URLs found
         """
+        # Parse the page URL once for relative-URL resolution and pattern guessing
+        split_url = urlsplit(page_url)
+        base_domain = f"{split_url.scheme}://{split_url.netloc}"
+        path_segments = split_url.path.rstrip('/').split('/')
+        post_id = next((part for part in reversed(path_segments) if part.isdigit()), None)
+        
         response = None
+        page_content = None
         
-        # First try: Standard request without bypass
+        # First try: Standard request without bypass, revalidating any cached copy
         try:
-            print("📡 기본 요청 시도 중...")
-            response = self.session.get(page_url, timeout=30)
+            logger.info("📡 기본 요청 시도 중...")
+            # One lookup for both the validators and a 304, as other threads may evict the entry
+            cached = self._page_cache.get(page_url)
+            response = self.session.get(page_url, timeout=30,
+                                        headers=self._conditional_headers(cached))
+            
+            # Check for stop once the page has arrived
+            if stop_callback and stop_callback():
+                raise ValueError("Download stopped by user")
             
             if response.status_code == 200:
-                print("✓ 기본 요청 성공!")
+                page_content = response.content
+                self._remember_page(page_url, response, page_content)
+                logger.info("✓ 기본 요청 성공!")
+            elif response.status_code == 304 and cached:
+                logger.info("✓ 페이지 변경 없음 - 캐시된 페이지 사용")
+                page_content = cached[2]
             elif response.status_code == 403:
-                print("⚠ 403 차단 감지, 우회 방법 시도...")
+                logger.warning("⚠ 403 차단 감지, 우회 방법 시도...")
                 response = None  # Reset response to trigger bypass
             else:
-                print(f"⚠ 응답 코드 {response.status_code}, 우회 방법 시도...")
+                logger.warning(f"⚠ 응답 코드 {response.status_code}, 우회 방법 시도...")
                 response = None  # Reset response to trigger bypass
                 
+        except ValueError:
+            raise  # Re-raise stop request
         except Exception as e:
-            print(f"⚠ 기본 요청 실패 ({e}), 우회 방법 시도...")
+            logger.warning(f"⚠ 기본 요청 실패 ({e}), 우회 방법 시도...")
             response = None
         
         # If basic request failed, try bypass methods
-        if not response or response.status_code != 200:
+        if page_content is None and (not response or response.status_code != 200):
             # Enhanced 403 bypass system
             bypass_methods = [
                 self._method_1_standard_request,
@@ -110,47 +698,29 @@ class AudioDownloader:
                 self._method_7_stealth_mode
             ]
             
-            for method_num, method in enumerate(bypass_methods, 1):
-                # Check if stop was requested
-                if stop_callback and stop_callback():
-                    print("🛑 사용자에 의해 우회 시도가 중단되었습니다.")
-                    raise ValueError("Download stopped by user during bypass attempt")
-                    
-                try:
-                    print(f"⚠ 우회 방법 {method_num} 시도 중...")
-                    response = method(page_url, stop_callback)
-                    if response and response.status_code == 200:
-                        print(f"✓ 우회 방법 {method_num} 성공!")
-                        break
-                        
-                except requests.exceptions.HTTPError as e:
-                    if stop_callback and stop_callback():
-                        print("🛑 사용자에 의해 우회 시도가 중단되었습니다.")
-                        raise ValueError("Download stopped by user during bypass attempt")
-                        
-                    if e.response and e.response.status_code == 403:
-                        print(f"✗ 방법 {method_num} 실패 (403)")
-                        continue
-                    else:
-                        print(f"✗ 방법 {method_num} 실패: {e}")
-                        continue
-                except Exception as e:
-                    if stop_callback and stop_callback():
-                        print("🛑 사용자에 의해 우회 시도가 중단되었습니다.")
-                        raise ValueError("Download stopped by user during bypass attempt")
-                        
-                    print(f"✗ 방법 {method_num} 실패: {e}")
-                    continue
+            response = self._race_bypass_methods(page_url, bypass_methods, stop_callback)
         
-        if not response or response.status_code != 200:
-            raise requests.RequestException("모든 우회 방법이 실패했습니다. 사이트가 강화된 차단을 사용하고 있을 수 있습니다.")
-            
-        soup = BeautifulSoup(response.content, 'html.parser')
+        if page_content is None:
+            if not response or response.status_code != 200:
+                raise requests.RequestException("모든 우회 방법이 실패했습니다. 사이트가 강화된 차단을 사용하고 있을 수 있습니다.")
+            page_content = response.content
+            self._remember_page(page_url, response, page_content)
+            
+        # Skip building tags that none of the detection methods look at
+        soup = _parse_html(page_content, parse_only=_AUDIO_ELEMENTS)
+        elements = _collect_elements(soup)
         audio_urls = []
+        seen_urls = set()
+        
+        def add_url(url: str, format_type: str) -> None:
+            # Skip URLs already found through another detection method
+            key = _normalize_url(url)
+            if key not in seen_urls:
+                seen_urls.add(key)
+                audio_urls.append((url, format_type))
         
         # Method 1: Look for audio sources in video elements
-        video_elements = soup.find_all('video')
-        for video in video_elements:
+        for video in elements['video']:
             sources = video.find_all('source')
             for source in sources:
                 src = source.get('src')
@@ -165,11 +735,10 @@ class AudioDownloader:
                     else:
                         format_type = 'audio'
                     
-                    audio_urls.append((src, format_type))
+                    add_url(src, format_type)
         
         # Method 2: Look for direct audio elements (excluding blob URLs)
-        audio_elements = soup.find_all('audio')
-        for audio in audio_elements:
+        for audio in elements['audio']:
             sources = audio.find_all('source')
             for source in sources:
                 src = source.get('src')
@@ -183,87 +752,62 @@ class AudioDownloader:
                     else:
                         format_type = 'audio'
                     
-                    audio_urls.append((src, format_type))
+                    add_url(src, format_type)
         
         # Method 3: Search for audio URLs in JavaScript code
-        script_tags = soup.find_all('script')
+        script_tags = elements['script']
+        
+        # Only scripts mentioning an audio file can match the URL regexes
+        # (here and in Method 6.5), so skip the rest with a cheap substring test
+        audio_scripts = []
         for script in script_tags:
-            if script.string:
-                script_content = script.string
-                
-                # Look for various patterns that might contain audio URLs
-                import re
-                
-                # Pattern for direct audio file URLs
-                audio_patterns = [
-                    r'["\']([^"\']*\.mp3)["\']',
-                    r'["\']([^"\']*\.m4a)["\']',
-                    r'["\']([^"\']*audio[^"\']*\.mp3)["\']',
-                    r'["\']([^"\']*audio[^"\']*\.m4a)["\']',
-                    r'url["\s]*:["\s]*["\']([^"\']*\.mp3)["\']',
-                    r'url["\s]*:["\s]*["\']([^"\']*\.m4a)["\']',
-                    r'src["\s]*:["\s]*["\']([^"\']*\.mp3)["\']',
-                    r'src["\s]*:["\s]*["\']([^"\']*\.m4a)["\']',
-                    r'audioUrl["\s]*:["\s]*["\']([^"\']*\.mp3)["\']',
-                    r'audioUrl["\s]*:["\s]*["\']([^"\']*\.m4a)["\']',
-                ]
-                
-                for pattern in audio_patterns:
-                    matches = re.findall(pattern, script_content, re.IGNORECASE)
-                    for match in matches:
-                        if match and not match.startswith('blob:'):
-                            # Make sure it's a valid URL
-                            if match.startswith('http') or match.startswith('/'):
-                                format_type = 'mp3' if '.mp3' in match.lower() else 'm4a'
-                                
-                                # Convert relative URLs to absolute
-                                if match.startswith('/'):
-                                    base_url = '/'.join(page_url.split('/')[:3])
-                                    match = base_url + match
-                                
-                                audio_urls.append((match, format_type))
+            script_content = script.string
+            if script_content:
+                lowered = script_content.lower()
+                if '.mp3' in lowered or '.m4a' in lowered:
+                    audio_scripts.append(script_content)
+        
+        for script_content in audio_scripts:
+            # Look for quoted strings that might contain audio URLs
+            for found in _AUDIO_URL_PATTERN.finditer(script_content):
+                match = found.group('quoted')
+                if match and not match.startswith('blob:'):
+                    # Make sure it's a valid URL
+                    if match.startswith('http') or match.startswith('/'):
+                        format_type = self._classify(match)
+                        
+                        # Convert relative URLs to absolute
+                        if match.startswith('/'):
+                            match = base_domain + match
+                        
+                        add_url(match, format_type)
         
         # Method 4: Look for data attributes that might contain audio URLs
-        all_elements = soup.find_all(attrs={'data-audio': True})
-        for element in all_elements:
+        for element in elements['data-audio']:
             audio_url = element.get('data-audio')
             if audio_url and not audio_url.startswith('blob:'):
-                format_type = 'mp3' if '.mp3' in audio_url.lower() else 'm4a'
+                format_type = self._classify(audio_url)
                 if audio_url.startswith('/'):
-                    base_url = '/'.join(page_url.split('/')[:3])
-                    audio_url = base_url + audio_url
-                audio_urls.append((audio_url, format_type))
+                    audio_url = base_domain + audio_url
+                add_url(audio_url, format_type)
         
         # Method 5: Look for common data attributes
-        for attr in ['data-src', 'data-url', 'data-file', 'data-audio-url']:
-            elements = soup.find_all(attrs={attr: True})
-            for element in elements:
+        for attr in _DATA_URL_ATTRS:
+            for element in elements[attr]:
                 url = element.get(attr)
-                if url and (url.endswith('.mp3') or url.endswith('.m4a')) and not url.startswith('blob:'):
-                    format_type = 'mp3' if '.mp3' in url.lower() else 'm4a'
+                if url and url.endswith(('.mp3', '.m4a')) and not url.startswith('blob:'):
+                    format_type = self._classify(url)
                     if url.startswith('/'):
-                        base_url = '/'.join(page_url.split('/')[:3])
-                        url = base_url + url
-                    audio_urls.append((url, format_type))
+                        url = base_domain + url
+                    add_url(url, format_type)
         
         # Method 6: Try to construct URLs based on page URL pattern
         # For japaneseasmr.com, try common patterns
         if 'japaneseasmr.com' in page_url and not audio_urls:
-            print("⚠ blob URL 감지 - 파일 패턴 추측 중...")
-            
-            # Extract post ID from URL
-            url_parts = page_url.rstrip('/').split('/')
-            post_id = None
-            
-            for part in reversed(url_parts):
-                if part.isdigit():
-                    post_id = part
-                    break
+            logger.warning("⚠ blob URL 감지 - 파일 패턴 추측 중...")
             
             if post_id:
                 # Try common file patterns for this site
-                base_domain = '/'.join(page_url.split('/')[:3])
-                
                 potential_patterns = [
                     f"{base_domain}/audio/{post_id}.mp3",
                     f"{base_domain}/audio/{post_id}.m4a",
@@ -298,168 +842,104 @@ class AudioDownloader:
                     f"{base_domain}/files/{post_id.zfill(6)}.m4a",
                 ]
                 
-                # Test each potential URL with bypass headers
-                for test_url in potential_patterns:
-                    try:
-                        print(f"  테스트 중: {test_url}")
-                        # Use the successful bypass headers from above
-                        headers = self.get_random_headers()
-                        head_response = self.session.head(test_url, headers=headers, timeout=10)
-                        if head_response.status_code == 200:
-                            format_type = 'mp3' if '.mp3' in test_url else 'm4a'
-                            audio_urls.append((test_url, format_type))
-                            print(f"  ✓ 발견: {test_url}")
-                            break
-                    except:
-                        continue
+                # Test all potential URLs concurrently with bypass headers
+                found_url = self._probe_first(potential_patterns, timeout=10, label="테스트 중")
+                if found_url:
+                    format_type = self._classify(found_url)
+                    add_url(found_url, format_type)
+                    logger.info(f"  ✓ 발견: {found_url}")
         
         # Method 6.5: Advanced JavaScript analysis for blob URL sites
         if 'japaneseasmr.com' in page_url and not audio_urls:
-            print("⚠ 고급 JavaScript 분석 시도 중...")
-            
-            # Look for patterns that might reveal actual file URLs
-            script_patterns = [
-                r'audioUrl["\s]*:["\s]*["\']([^"\']*\.mp3)["\']',
-                r'audioUrl["\s]*:["\s]*["\']([^"\']*\.m4a)["\']',
-                r'src["\s]*:["\s]*["\']([^"\']*\.mp3)["\']',
-                r'src["\s]*:["\s]*["\']([^"\']*\.m4a)["\']',
-                r'file["\s]*:["\s]*["\']([^"\']*\.mp3)["\']',
-                r'file["\s]*:["\s]*["\']([^"\']*\.m4a)["\']',
-                r'audio["\s]*:["\s]*["\']([^"\']*\.mp3)["\']',
-                r'audio["\s]*:["\s]*["\']([^"\']*\.m4a)["\']',
-                r'url["\s]*=["\s]*["\']([^"\']*\.mp3)["\']',
-                r'url["\s]*=["\s]*["\']([^"\']*\.m4a)["\']',
-                # Look for direct file references in variable assignments
-                r'var\s+\w+\s*=\s*["\']([^"\']*\.mp3)["\']',
-                r'var\s+\w+\s*=\s*["\']([^"\']*\.m4a)["\']',
-                r'let\s+\w+\s*=\s*["\']([^"\']*\.mp3)["\']',
-                r'let\s+\w+\s*=\s*["\']([^"\']*\.m4a)["\']',
-                r'const\s+\w+\s*=\s*["\']([^"\']*\.mp3)["\']',
-                r'const\s+\w+\s*=\s*["\']([^"\']*\.m4a)["\']',
-                # WordPress media library patterns
-                r'wp-content/uploads/[^"\']*\.mp3',
-                r'wp-content/uploads/[^"\']*\.m4a',
-            ]
-            
-            for script in script_tags:
-                if script.string:
-                    script_content = script.string
-                    
-                    for pattern in script_patterns:
-                        matches = re.findall(pattern, script_content, re.IGNORECASE)
-                        for match in matches:
-                            if match and not match.startswith('blob:'):
-                                # Make sure it's a valid URL
-                                if match.startswith('http') or match.startswith('/'):
-                                    format_type = 'mp3' if '.mp3' in match.lower() else 'm4a'
-                                    
-                                    # Convert relative URLs to absolute
-                                    if match.startswith('/'):
-                                        base_url = '/'.join(page_url.split('/')[:3])
-                                        match = base_url + match
-                                    
-                                    # Verify the URL actually works with bypass headers
-                                    try:
-                                        print(f"  JS에서 발견된 URL 검증 중: {match}")
-                                        headers = self.get_random_headers()
-                                        head_response = self.session.head(match, headers=headers, timeout=10)
-                                        if head_response.status_code == 200:
-                                            audio_urls.append((match, format_type))
-                                            print(f"  ✓ JS에서 유효한 URL 발견: {match}")
-                                    except:
-                                        continue
+            logger.warning("⚠ 고급 JavaScript 분석 시도 중...")
+            
+            js_candidates = []
+            for script_content in audio_scripts:
+                for found in _JS_AUDIO_URL_PATTERN.finditer(script_content):
+                    match = found.group(found.lastgroup)
+                    if match and not match.startswith('blob:'):
+                        # Make sure it's a valid URL
+                        if match.startswith('http') or match.startswith('/'):
+                            # Convert relative URLs to absolute
+                            if match.startswith('/'):
+                                match = base_domain + match
+                            
+                            if _normalize_url(match) not in seen_urls:
+                                js_candidates.append(match)
+            
+            # Verify the URLs actually work with bypass headers, all in one batch
+            for match in self._probe_all(js_candidates, timeout=10, label="JS에서 발견된 URL 검증 중"):
+                format_type = self._classify(match)
+                add_url(match, format_type)
+                logger.info(f"  ✓ JS에서 유효한 URL 발견: {match}")
 
         # Method 6.7: Look for base64 encoded URLs or other encoded patterns
         if 'japaneseasmr.com' in page_url and not audio_urls:
-            print("⚠ 인코딩된 URL 패턴 검색 중...")
+            logger.warning("⚠ 인코딩된 URL 패턴 검색 중...")
             
             # Look for base64 patterns that might contain URLs
-            import base64
-            
+            base64_candidates = []
             for script in script_tags:
-                if script.string:
-                    script_content = script.string
-                    
+                script_content = script.string
+                # Cheap substring check before running the regex and decoding
+                if script_content and any(marker in script_content for marker in _BASE64_HTTP_MARKERS):
                     # Look for base64 patterns
-                    base64_patterns = re.findall(r'["\']([A-Za-z0-9+/]{20,}={0,2})["\']', script_content)
+                    base64_patterns = _BASE64_PATTERN.findall(script_content)
                     
                     for b64_string in base64_patterns:
                         try:
                             decoded = base64.b64decode(b64_string).decode('utf-8', errors='ignore')
                             if '.mp3' in decoded or '.m4a' in decoded:
                                 # Extract potential URLs from decoded content
-                                url_matches = re.findall(r'https?://[^\s"\'<>]+\.(?:mp3|m4a)', decoded)
+                                url_matches = _ABSOLUTE_AUDIO_URL_PATTERN.findall(decoded)
                                 for url_match in url_matches:
-                                    format_type = 'mp3' if '.mp3' in url_match.lower() else 'm4a'
-                                    print(f"  Base64에서 발견된 URL 검증 중: {url_match}")
-                                    try:
-                                        headers = self.get_random_headers()
-                                        head_response = self.session.head(url_match, headers=headers, timeout=10)
-                                        if head_response.status_code == 200:
-                                            audio_urls.append((url_match, format_type))
-                                            print(f"  ✓ Base64에서 유효한 URL 발견: {url_match}")
-                                    except:
-                                        continue
-                        except:
+                                    if _normalize_url(url_match) not in seen_urls:
+                                        base64_candidates.append(url_match)
+                        except binascii.Error:
                             continue
+            
+            for url_match in self._probe_all(base64_candidates, timeout=10, label="Base64에서 발견된 URL 검증 중"):
+                format_type = self._classify(url_match)
+                add_url(url_match, format_type)
+                logger.info(f"  ✓ Base64에서 유효한 URL 발견: {url_match}")
 
         # Method 6.8: Site-specific analysis for japaneseasmr.com
         if 'japaneseasmr.com' in page_url and not audio_urls:
-            print("⚠ japaneseasmr.com 특화 분석 시도 중...")
-            
-            # Extract post ID from URL
-            url_parts = page_url.rstrip('/').split('/')
-            post_id = None
-            
-            for part in reversed(url_parts):
-                if part.isdigit():
-                    post_id = part
-                    break
+            logger.warning("⚠ japaneseasmr.com 특화 분석 시도 중...")
             
             if post_id:
-                base_domain = '/'.join(page_url.split('/')[:3])
-                
                 # Try to find any form or AJAX endpoint that might reveal the file location
-                forms = soup.find_all('form')
-                for form in forms:
+                for form in elements['form']:
                     action = form.get('action', '')
                     if 'download' in action.lower() or 'audio' in action.lower():
-                        print(f"  Form action 발견: {action}")
+                        logger.info(f"  Form action 발견: {action}")
                 
                 # Look for any div or element with audio-related classes or IDs
-                audio_containers = soup.find_all(['div', 'section', 'article'], 
-                    class_=lambda x: x and any(keyword in x.lower() for keyword in ['audio', 'player', 'media', 'download']))
-                
-                for container in audio_containers:
+                for container in elements['container']:
                     # Look for data attributes that might contain file info
                     for attr_name in container.attrs:
                         if 'data' in attr_name.lower():
                             attr_value = container.attrs[attr_name]
                             if isinstance(attr_value, str) and (post_id in attr_value or '.mp3' in attr_value.lower() or '.m4a' in attr_value.lower()):
-                                print(f"  Audio container에서 발견: {attr_name}={attr_value}")
+                                logger.info(f"  Audio container에서 발견: {attr_name}={attr_value}")
                 
                 # Look for any hidden input fields that might contain file URLs
-                hidden_inputs = soup.find_all('input', type='hidden')
-                for hidden_input in hidden_inputs:
+                hidden_candidates = []
+                for hidden_input in elements['hidden_input']:
                     value = hidden_input.get('value', '')
                     if value and (post_id in value or '.mp3' in value.lower() or '.m4a' in value.lower()):
-                        print(f"  Hidden input에서 발견: {hidden_input.get('name')}={value}")
+                        logger.info(f"  Hidden input에서 발견: {hidden_input.get('name')}={value}")
                         
                         # If this looks like a URL, try to use it
                         if value.startswith(('http', '/')):
-                            format_type = 'mp3' if '.mp3' in value.lower() else 'm4a'
                             if value.startswith('/'):
                                 value = base_domain + value
-                            
-                            try:
-                                print(f"  Hidden input URL 검증 중: {value}")
-                                headers = self.get_random_headers()
-                                head_response = self.session.head(value, headers=headers, timeout=10)
-                                if head_response.status_code == 200:
-                                    audio_urls.append((value, format_type))
-                                    print(f"  ✓ Hidden input에서 유효한 URL 발견: {value}")
-                            except:
-                                continue
+                            hidden_candidates.append(value)
+                
+                for value in self._probe_all(hidden_candidates, timeout=10, label="Hidden input URL 검증 중"):
+                    format_type = self._classify(value)
+                    add_url(value, format_type)
+                    logger.info(f"  ✓ Hidden input에서 유효한 URL 발견: {value}")
                 
                 # Try to make an AJAX-like request to common API endpoints with bypass headers
                 api_endpoints = [
@@ -470,37 +950,23 @@ class AudioDownloader:
                     f"{base_domain}/get_audio.php?id={post_id}",
                 ]
                 
-                for api_url in api_endpoints:
-                    try:
-                        print(f"  API 엔드포인트 시도: {api_url}")
-                        headers = self.get_random_headers()
-                        api_response = self.session.get(api_url, headers=headers, timeout=10)
-                        if api_response.status_code == 200:
-                            response_text = api_response.text
-                            # Look for URLs in the API response
-                            url_matches = re.findall(r'https?://[^\s"\'<>]+\.(?:mp3|m4a)', response_text)
-                            for url_match in url_matches:
-                                format_type = 'mp3' if '.mp3' in url_match.lower() else 'm4a'
-                                audio_urls.append((url_match, format_type))
-                                print(f"  ✓ API에서 URL 발견: {url_match}")
-                    except:
-                        continue
+                with ThreadPoolExecutor(max_workers=len(api_endpoints)) as executor:
+                    api_texts = list(executor.map(self._fetch_api_text, api_endpoints))
+                
+                for response_text in api_texts:
+                    if response_text:
+                        # Look for URLs in the API response
+                        url_matches = _ABSOLUTE_AUDIO_URL_PATTERN.findall(response_text)
+                        for url_match in url_matches:
+                            format_type = self._classify(url_match)
+                            add_url(url_match, format_type)
+                            logger.info(f"  ✓ API에서 URL 발견: {url_match}")
         
         # Method 6.9: Last resort - try direct file access with common naming patterns
         if 'japaneseasmr.com' in page_url and not audio_urls:
-            print("⚠ 최후 수단 - 일반적인 파일명 패턴 시도 중...")
-            
-            url_parts = page_url.rstrip('/').split('/')
-            post_id = None
-            
-            for part in reversed(url_parts):
-                if part.isdigit():
-                    post_id = part
-                    break
+            logger.warning("⚠ 최후 수단 - 일반적인 파일명 패턴 시도 중...")
             
             if post_id:
-                base_domain = '/'.join(page_url.split('/')[:3])
-                
                 # Try even more file patterns based on common WordPress/CMS patterns
                 last_resort_patterns = [
                     # WordPress uploads with year/month structure
@@ -521,270 +987,310 @@ class AudioDownloader:
                     f"{base_domain}/audio/{post_id}.flac",
                 ]
                 
-                for test_url in last_resort_patterns:
-                    try:
-                        print(f"  최후 패턴 테스트: {test_url}")
-                        headers = self.get_random_headers()
-                        head_response = self.session.head(test_url, headers=headers, timeout=5)
-                        if head_response.status_code == 200:
-                            # Determine format from URL
-                            if '.mp3' in test_url:
-                                format_type = 'mp3'
-                            elif '.m4a' in test_url:
-                                format_type = 'm4a'
-                            elif '.wav' in test_url:
-                                format_type = 'wav'
-                            elif '.flac' in test_url:
-                                format_type = 'flac'
-                            else:
-                                format_type = 'audio'
-                            
-                            audio_urls.append((test_url, format_type))
-                            print(f"  ✓ 최후 패턴에서 발견: {test_url}")
-                            break
-                    except:
-                        continue
+                test_url = self._probe_first(last_resort_patterns, timeout=5, label="최후 패턴 테스트")
+                if test_url:
+                    # Determine format from URL
+                    add_url(test_url, self._classify(test_url))
+                    logger.info(f"  ✓ 최후 패턴에서 발견: {test_url}")
         
         # Method 7: Look for any links to audio files in the entire page
-        all_links = soup.find_all('a', href=True)
-        for link in all_links:
+        for link in elements['link']:
             href = link.get('href')
-            if href and (href.endswith('.mp3') or href.endswith('.m4a')):
-                format_type = 'mp3' if '.mp3' in href.lower() else 'm4a'
+            if href and href.endswith(('.mp3', '.m4a')):
+                format_type = self._classify(href)
                 if href.startswith('/'):
-                    base_url = '/'.join(page_url.split('/')[:3])
-                    href = base_url + href
-                audio_urls.append((href, format_type))
+                    href = base_domain + href
+                add_url(href, format_type)
         
         if not audio_urls:
             raise ValueError("No audio URLs found on the webpage")
             
         return audio_urls
     
+    def _head_ok(self, test_url: str, timeout: float, label: str) -> bool:
+        """Return True if a HEAD request to the URL answers 200."""
+        try:
+            logger.info(f"  {label}: {test_url}")
+            return self._head(test_url, timeout) == 200
+        except Exception:
+            return False
+    
+    def _proxy_for(self, url: str) -> Optional[str]:
+        """Return the proxy self.session would route a URL through, or None if it goes direct."""
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        if key not in self._proxy_by_host:
+            # Same environment/NO_PROXY lookup requests does per request, done once per host
+            proxies = self.session.merge_environment_settings(url, {}, None, None, None)['proxies']
+            self._proxy_by_host[key] = requests.utils.select_proxy(url, proxies)
+        return self._proxy_by_host[key]
+    
+    def _head(self, url: str, timeout: float) -> int:
+        """
+        Send a HEAD request through the bare urllib3 pool (or the session, behind a proxy).
+        
+        Args:
+            url: URL to check
+            timeout: Connect and read timeout in seconds
+            
+        Returns:
+            HTTP status code of the response
+        """
+        headers = self.get_random_headers()
+        # Carry over cookies picked up by the session (e.g. from establish_session)
+        cookie_header = get_cookie_header(self.session.cookies, requests.Request('HEAD', url))
+        if cookie_header:
+            headers['Cookie'] = cookie_header
+        
+        # Keep the number of in-flight probes per host polite
+        host_slot = self._host_slots.setdefault(urlsplit(url).netloc,
+                                                threading.BoundedSemaphore(_PROBES_PER_HOST))
+        with host_slot:
+            if self._proxy_for(url):
+                # Let requests handle the proxy (including its auth and SOCKS support)
+                return self.session.head(url, headers=headers, timeout=timeout).status_code
+            head_response = self._pool.request('HEAD', url, headers=headers, timeout=timeout, retries=False)
+        return head_response.status
+    
+    def _probe_first(self, test_urls: List[str], timeout: float, label: str) -> Optional[str]:
+        """
+        Probe candidate URLs concurrently and return the first one that exists.
+        
+        Args:
+            test_urls: Candidate file URLs to check with HEAD requests
+            timeout: Per-request timeout in seconds
+            label: Log prefix printed for each probe
+            
+        Returns:
+            The first URL answering 200, or None if none did
+        """
+        executor = ThreadPoolExecutor(max_workers=_PROBE_WORKERS)
+        futures = {executor.submit(self._head_ok, test_url, timeout, label): test_url for test_url in test_urls}
+        try:
+            for future in as_completed(futures):
+                if future.result():
+                    return futures[future]
+            return None
+        finally:
+            # Don't wait for the remaining probes once we have an answer
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _probe_all(self, test_urls: List[str], timeout: float, label: str) -> List[str]:
+        """
+        Probe candidate URLs concurrently and return every one that exists.
+        
+        Args:
+            test_urls: Candidate file URLs to check with HEAD requests
+            timeout: Per-request timeout in seconds
+            label: Log prefix printed for each probe
+            
+        Returns:
+            URLs answering 200, in their original order without duplicates
+        """
+        test_urls = list(dict.fromkeys(test_urls))
+        if not test_urls:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(_PROBE_WORKERS, len(test_urls))) as executor:
+            results = executor.map(lambda test_url: self._head_ok(test_url, timeout, label), test_urls)
+            return [test_url for test_url, ok in zip(test_urls, results) if ok]
+    
+    def _race_bypass_methods(self, page_url: str, bypass_methods: list,
+                             stop_callback=None) -> Optional[requests.Response]:
+        """
+        Run the bypass methods concurrently and return the first successful response.
+        
+        Method starts are staggered by _BYPASS_STAGGER. The remaining methods
+        are told to stop through their stop callback once a winner is found,
+        so they abort at their next delay checkpoint.
+        
+        Args:
+            page_url: URL of the webpage to fetch
+            bypass_methods: Bypass methods to race, numbered from 1 in order
+            stop_callback: Optional callback function that returns True if download should stop
+            
+        Returns:
+            The first response with status 200, or None if every method failed
+            
+        Raises:
+            ValueError: If stop was requested by the user
+        """
+        race_done = threading.Event()
+        
+        def should_stop() -> bool:
+            return race_done.is_set() or bool(stop_callback and stop_callback())
+        
+        def run_staggered(method, start_delay: float) -> requests.Response:
+            self._sleep_or_stop(start_delay, should_stop)
+            return method(page_url, should_stop)
+        
+        logger.warning(f"⚠ 우회 방법 1-{len(bypass_methods)} 동시 시도 중...")
+        executor = ThreadPoolExecutor(max_workers=len(bypass_methods))
+        futures = {executor.submit(run_staggered, method, index * _BYPASS_STAGGER): index + 1
+                   for index, method in enumerate(bypass_methods)}
+        pending = set(futures)
+        try:
+            while pending:
+                # Check if stop was requested
+                if self.stop_event.is_set() or (stop_callback and stop_callback()):
+                    logger.warning("🛑 사용자에 의해 우회 시도가 중단되었습니다.")
+                    raise ValueError("Download stopped by user during bypass attempt")
+                    
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in done:
+                    method_num = futures[future]
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        logger.warning(f"✗ 방법 {method_num} 실패: {e}")
+                        continue
+                        
+                    if response is not None and response.status_code == 200:
+                        logger.info(f"✓ 우회 방법 {method_num} 성공!")
+                        return response
+                    logger.warning(f"✗ 방법 {method_num} 실패 ({getattr(response, 'status_code', None)})")
+            return None
+        finally:
+            race_done.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _fetch_api_text(self, api_url: str) -> str:
+        """GET an API endpoint and return its body, or an empty string on failure."""
+        try:
+            logger.info(f"  API 엔드포인트 시도: {api_url}")
+            headers = self.get_random_headers()
+            api_response = self.session.get(api_url, headers=headers, timeout=10)
+            if api_response.status_code == 200:
+                return api_response.text
+        except Exception:
+            pass
+        return ""
+    
+    def _sleep_or_stop(self, delay: float, stop_callback=None) -> None:
+        """
+        Sleep for the given delay unless a stop is requested.
+        
+        Waits on stop_event, so setting it ends the delay at once; the
+        stop_callback is checked when the wait finishes.
+        
+        Raises:
+            ValueError: If stop was requested
+        """
+        if self.stop_event.wait(delay) or (stop_callback and stop_callback()):
+            raise ValueError("Download stopped by user")
+    
     def _method_1_standard_request(self, page_url: str, stop_callback=None) -> requests.Response:
         """Standard request with enhanced headers."""
         headers = self.get_random_headers()
-        delay = random.uniform(0.2, 0.5)
         
-        # Check for stop during delay
-        for _ in range(int(delay * 10)):  # Check every 0.1 seconds
-            if stop_callback and stop_callback():
-                raise ValueError("Download stopped by user")
-            time.sleep(0.1)
+        # Random delay, waking immediately on stop
+        self._sleep_or_stop(random.uniform(0.2, 0.5), stop_callback)
         
         return self.session.get(page_url, timeout=30, headers=headers)
     
     def _method_2_mobile_headers(self, page_url: str, stop_callback=None) -> requests.Response:
         """Mobile device simulation."""
-        delay = random.uniform(0.2, 0.5)
-        
-        # Check for stop during delay
-        for _ in range(int(delay * 10)):  # Check every 0.1 seconds
-            if stop_callback and stop_callback():
-                raise ValueError("Download stopped by user")
-            time.sleep(0.1)
-            
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Referer': 'https://japaneseasmr.com/',
-            'DNT': '1',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        return self.session.get(page_url, timeout=30, headers=headers)
+        # Random delay, waking immediately on stop
+        self._sleep_or_stop(random.uniform(0.2, 0.5), stop_callback)
+            
+        return self.session.get(page_url, timeout=30, headers=_MOBILE_HEADERS)
     
     def _method_3_firefox_simulation(self, page_url: str, stop_callback=None) -> requests.Response:
         """Firefox browser simulation."""
-        delay = random.uniform(0.2, 0.5)
-        
-        # Check for stop during delay
-        for _ in range(int(delay * 10)):  # Check every 0.1 seconds
-            if stop_callback and stop_callback():
-                raise ValueError("Download stopped by user")
-            time.sleep(0.1)
-            
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Referer': 'https://japaneseasmr.com/',
-        }
-        return self.session.get(page_url, timeout=30, headers=headers)
+        # Random delay, waking immediately on stop
+        self._sleep_or_stop(random.uniform(0.2, 0.5), stop_callback)
+            
+        return self.session.get(page_url, timeout=30, headers=_FIREFOX_HEADERS)
     
     def _method_4_minimal_headers(self, page_url: str, stop_callback=None) -> requests.Response:
         """Minimal headers approach."""
-        delay = random.uniform(0.2, 0.5)
-        
-        # Check for stop during delay
-        for _ in range(int(delay * 10)):  # Check every 0.1 seconds
-            if stop_callback and stop_callback():
-                raise ValueError("Download stopped by user")
-            time.sleep(0.1)
+        # Random delay, waking immediately on stop
+        self._sleep_or_stop(random.uniform(0.2, 0.5), stop_callback)
             
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': '*/*',
-            'Connection': 'keep-alive',
-        }
-        return self.session.get(page_url, timeout=30, headers=headers)
+        return self.session.get(page_url, timeout=30, headers=_MINIMAL_HEADERS)
     
     def _method_5_session_rotation(self, page_url: str, stop_callback=None) -> requests.Response:
         """Create new session with different configuration."""
-        delay = random.uniform(0.2, 0.5)
-        
-        # Check for stop during delay
-        for _ in range(int(delay * 10)):  # Check every 0.1 seconds
-            if stop_callback and stop_callback():
-                raise ValueError("Download stopped by user")
-            time.sleep(0.1)
-            
-        new_session = requests.Session()
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Cache-Control': 'max-age=0',
-            'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"macOS"',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-        }
-        return new_session.get(page_url, timeout=30, headers=headers)
+        # Random delay, waking immediately on stop
+        self._sleep_or_stop(random.uniform(0.2, 0.5), stop_callback)
+            
+        new_session = self._new_session()
+        return new_session.get(page_url, timeout=30, headers=_MAC_CHROME_HEADERS)
     
     def _method_6_proxy_style(self, page_url: str, stop_callback=None) -> requests.Response:
         """Proxy-like request with different approach."""
-        delay = random.uniform(0.2, 0.5)
-        
-        # Check for stop during delay
-        for _ in range(int(delay * 10)):  # Check every 0.1 seconds
-            if stop_callback and stop_callback():
-                raise ValueError("Download stopped by user")
-            time.sleep(0.1)
+        # Random delay, waking immediately on stop
+        self._sleep_or_stop(random.uniform(0.2, 0.5), stop_callback)
         
         # Visit homepage first to establish session
         try:
-            domain = '/'.join(page_url.split('/')[:3])
+            domain = _origin(page_url)
             self.session.get(domain, timeout=15)
             
             # Check for stop after first request
             if stop_callback and stop_callback():
                 raise ValueError("Download stopped by user")
                 
-            time.sleep(0.2)  # Reduced delay
+            self._sleep_or_stop(0.2, stop_callback)  # Reduced delay
         except ValueError:
             raise  # Re-raise stop request
         except:
             pass
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9,ko;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Cache-Control': 'no-cache',
-            'Connection': 'keep-alive',
-            'DNT': '1',
-            'Pragma': 'no-cache',
-            'Referer': 'https://google.com/',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'cross-site',
-            'Sec-Fetch-User': '?1',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        return self.session.get(page_url, timeout=30, headers=headers)
+        return self.session.get(page_url, timeout=30, headers=_PROXY_STYLE_HEADERS)
     
     def _method_7_stealth_mode(self, page_url: str, stop_callback=None) -> requests.Response:
         """Advanced stealth mode with multiple steps."""
-        delay = random.uniform(0.2, 0.5)
+        # Random delay, waking immediately on stop
+        self._sleep_or_stop(random.uniform(0.2, 0.5), stop_callback)
         
-        # Check for stop during delay
-        for _ in range(int(delay * 10)):  # Check every 0.1 seconds
-            if stop_callback and stop_callback():
-                raise ValueError("Download stopped by user")
-            time.sleep(0.1)
-        
-        # Create completely new session
-        stealth_session = requests.Session()
+        # Create completely new session (fresh cookies, pooled connections)
+        stealth_session = self._new_session()
         
         # Step 1: Visit main domain
         try:
-            domain = '/'.join(page_url.split('/')[:3])
-            basic_headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'ko-KR,ko;q=0.9',
-                'Connection': 'keep-alive',
-            }
-            stealth_session.get(domain, headers=basic_headers, timeout=15)
+            domain = _origin(page_url)
+            stealth_session.get(domain, headers=_STEALTH_WARMUP_HEADERS, timeout=15)
             
             # Check for stop after first request
             if stop_callback and stop_callback():
                 raise ValueError("Download stopped by user")
                 
             # Reduced delay with stop checking
-            delay = random.uniform(0.1, 0.3)
-            for _ in range(int(delay * 10)):
-                if stop_callback and stop_callback():
-                    raise ValueError("Download stopped by user")
-                time.sleep(0.1)
+            self._sleep_or_stop(random.uniform(0.1, 0.3), stop_callback)
         except ValueError:
             raise  # Re-raise stop request
         except:
             pass
         
         # Step 2: Make the actual request with full headers
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Cache-Control': 'max-age=0',
-            'Connection': 'keep-alive',
-            'DNT': '1',
-            'Referer': f'{"/".join(page_url.split("/")[:3])}/',
-            'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"Windows"',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'same-origin',
-            'Sec-Fetch-User': '?1',
-            'Upgrade-Insecure-Requests': '1',
-        }
+        headers = {**_STEALTH_HEADERS, 'Referer': f'{_origin(page_url)}/'}
         
         return stealth_session.get(page_url, timeout=30, headers=headers)
     
-    def extract_title(self, page_url: str) -> str:
+    def extract_title(self, page_url: str, html: Optional[bytes] = None) -> str:
         """
         Extract title from the webpage for filename.
         
         Args:
             page_url: URL of the webpage
+            html: Page content if already fetched; defaults to the copy cached
+                by extract_audio_urls, fetching the page only if there is none
             
         Returns:
             Cleaned title string
         """
         try:
-            response = self.session.get(page_url, timeout=30)
-            response.raise_for_status()
+            cached = self._page_cache.get(page_url)
+            if html is None and cached:
+                html = cached[2]
+            if html is None:
+                response = self.session.get(page_url, timeout=30)
+                response.raise_for_status()
+                html = response.content
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Only the <title> element is needed
+            soup = _parse_html(html, parse_only=SoupStrainer('title'))
             
             # Try to get title from various sources
             title_element = soup.find('title')
@@ -792,12 +1298,12 @@ class AudioDownloader:
                 title = title_element.get_text().strip()
             else:
                 # Fallback to URL-based naming
-                parsed_url = urlparse(page_url)
+                parsed_url = urlsplit(page_url)
                 title = parsed_url.path.split('/')[-1] or 'audio'
             
             # Clean the title for use as filename
-            title = re.sub(r'[<>:"/\\|?*]', '', title)
-            title = re.sub(r'\s+', ' ', title).strip()
+            title = title.translate(_FILENAME_BAD_CHARS)
+            title = _WHITESPACE_PATTERN.sub(' ', title).strip()
             
             # Limit length to avoid filesystem issues
             if len(title) > 100:
@@ -811,7 +1317,7 @@ class AudioDownloader:
     
     def establish_session(self, page_url: str) -> bool:
         """
-        Establish a valid session by visiting the webpage first.
+        Establish a valid session by visiting the webpage first (once per host).
         
         Args:
             page_url: URL of the webpage to establish session with
@@ -819,43 +1325,202 @@ class AudioDownloader:
         Returns:
             True if session established successfully
         """
+        host = urlsplit(page_url).netloc
+        if host in self._primed_hosts:
+            return True
+        
         try:
-            print("세션 설정 중...")
+            logger.info("세션 설정 중...")
             
             # Add delay to avoid being flagged as bot
-            time.sleep(1)
+            if self.stop_event.wait(1):
+                return False
             
             # First visit with basic headers
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Referer': 'https://japaneseasmr.com/',
-            }
-            
-            response = self.session.get(page_url, timeout=30, headers=headers)
+            response = self.session.get(page_url, timeout=30, headers=_ESTABLISH_SESSION_HEADERS)
             response.raise_for_status()
             
             # Small delay to mimic human behavior
-            time.sleep(2)
+            if self.stop_event.wait(2):
+                return False
             
-            print("✓ 세션 설정 완료")
+            self._primed_hosts.add(host)
+            logger.info("✓ 세션 설정 완료")
             return True
             
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 403:
-                print("⚠ 403 오류 - 세션 설정 실패")
+                logger.warning("⚠ 403 오류 - 세션 설정 실패")
                 return False
             else:
-                print(f"⚠ 경고: 세션 설정 실패: {e}")
+                logger.warning(f"⚠ 경고: 세션 설정 실패: {e}")
                 return False
         except Exception as e:
-            print(f"⚠ 경고: 세션 설정 실패: {e}")
+            logger.warning(f"⚠ 경고: 세션 설정 실패: {e}")
             return False
 
-    def download_file(self, url: str, filename: str, page_url: str = "") -> bool:
+    def establish_sessions(self, page_urls: List[str], executor: ThreadPoolExecutor) -> None:
+        """
+        Establish sessions for all hosts of several webpages at the same time.
+        
+        Args:
+            page_urls: URLs of the webpages; the first one of each new host is visited
+            executor: Pool to run the visits on
+        """
+        first_pages = {}
+        for page_url in page_urls:
+            first_pages.setdefault(urlsplit(page_url).netloc, page_url)
+        
+        pending = [page_url for host, page_url in first_pages.items() if host not in self._primed_hosts]
+        list(executor.map(self.establish_session, pending))
+
+    def request_download(self, url: str, page_url: str = "", headers: Optional[dict] = None,
+                         probe_ranges: bool = False) -> requests.Response:
+        """
+        Send the streaming GET for a file, switching header profiles while the server refuses it.
+        
+        With probe_ranges the first request asks for byte 0 only. If the file is worth
+        fetching in ranges (see supports_ranges), that finished 206 response is returned
+        for its headers. Otherwise the whole file is requested with the headers that
+        worked, unless the server ignored the range and is already sending all of it.
+        
+        Args:
+            url: Direct URL to the audio file
+            page_url: Original webpage URL for referer header
+            headers: Optional headers to try before the built-in profiles
+            probe_ranges: Check whether the file can be fetched in ranges first
+            
+        Returns:
+            The last response received (the caller checks its status)
+        """
+        # Add referer if page URL is provided
+        page_headers = {'Referer': page_url, 'Origin': _origin(page_url)} if page_url else {}
+        candidates = [headers] if headers else []
+        candidates += [{**profile, **page_headers} for profile in _DOWNLOAD_HEADER_PROFILES]
+        
+        # Try each header set in turn on the same pooled connection
+        for attempt, download_headers in enumerate(candidates, 1):
+            if probe_ranges:
+                download_headers = {**download_headers, 'Range': 'bytes=0-0'}
+            response = self.session.get(url, headers=download_headers, stream=True, timeout=30)
+            if response.status_code in (403, 429) and attempt < len(candidates):
+                logger.warning(f"⚠ {response.status_code} 응답 - 다른 헤더 프로필로 재시도 ({attempt + 1}/{len(candidates)})")
+                response.close()
+                continue
+            break
+        
+        # A 416 here means the file is empty
+        if probe_ranges and response.status_code in (206, 416):
+            # Reading the probe's body (at most one byte) hands the connection back to the pool
+            response.content
+            if not self.supports_ranges(response):
+                # Not worth splitting; fetch the whole file with the headers that just worked
+                del download_headers['Range']
+                response = self.session.get(url, headers=download_headers, stream=True, timeout=30)
+        return response
+
+    @staticmethod
+    def file_size(response: requests.Response) -> int:
+        """Get the size of the whole file from a download response (0 if the server didn't say)."""
+        if response.status_code == 206:
+            # Content-Range: bytes <first>-<last>/<size>
+            size = response.headers.get('Content-Range', '').rpartition('/')[2]
+            return int(size) if size.isdigit() else 0
+        return int(response.headers.get('Content-Length', 0))
+    
+    @staticmethod
+    def supports_ranges(response: requests.Response) -> bool:
+        """Check whether a byte-0 probe shows a file large enough, and plain enough, to fetch in ranges."""
+        if response.status_code != 206 or 'Content-Encoding' in response.headers:
+            return False
+        return AudioDownloader.file_size(response) > _RANGED_MIN_SIZE
+    
+    def _fetch_range(self, url: str, part_filename: str, start: int, end: int,
+                     headers: dict, progress, abort: threading.Event) -> bool:
+        """Download bytes start..end of a file into the same offsets of part_filename."""
+        range_headers = {**headers, 'Range': f'bytes={start}-{end}', 'Accept-Encoding': 'identity'}
+        with self.session.get(url, headers=range_headers, stream=True, timeout=30) as response:
+            # A 200 means the server ignored Range and is sending the whole file
+            if response.status_code != 206:
+                response.raise_for_status()
+                return False
+            
+            written = 0
+            with open(part_filename, 'r+b') as file:
+                file.seek(start)
+                for chunk in response.iter_content(_COPY_BUFFER_SIZE):
+                    if abort.is_set() or self.stop_event.is_set():
+                        return False
+                    file.write(chunk)
+                    written += len(chunk)
+                    if progress:
+                        progress(len(chunk))
+        
+        if written != end - start + 1:
+            raise requests.RequestException(f"Range {start}-{end} ended after {written} bytes")
+        return True
+    
+    def download_ranges(self, url: str, part_filename: str, total_size: int,
+                        headers: dict, progress=None) -> bool:
+        """
+        Download a file as _RANGED_PARTS byte ranges fetched concurrently.
+        
+        Args:
+            url: Direct URL to the audio file
+            part_filename: File to write; it is sized to total_size first
+            total_size: Length of the file in bytes
+            headers: Request headers that the server accepted for this file
+            progress: Optional callback receiving the size of every block written
+            
+        Returns:
+            True if every range arrived, False if the server ignored Range or a stop
+            was requested (the caller can then fall back to a single stream). Unless
+            True is returned, part_filename is removed: its gaps make it unresumable.
+        """
+        # Cookies come from the session; the Range/encoding headers are set per part
+        headers = {key: value for key, value in headers.items()
+                   if key.lower() not in ('cookie', 'range', 'accept-encoding')}
+        
+        # Size the file up front so every part can be written at its own offset
+        with open(part_filename, 'wb') as file:
+            _preallocate(file, total_size)
+        
+        part_size = -(-total_size // _RANGED_PARTS)
+        ranges = [(start, min(start + part_size, total_size) - 1)
+                  for start in range(0, total_size, part_size)]
+        
+        # Any failed part stops the others early
+        abort = threading.Event()
+        completed = False
+        try:
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [executor.submit(self._fetch_range, url, part_filename, start, end,
+                                           headers, progress, abort)
+                           for start, end in ranges]
+                results = []
+                for future in as_completed(futures):
+                    try:
+                        part_done = future.result()
+                    except Exception:
+                        abort.set()
+                        raise
+                    if not part_done:
+                        abort.set()
+                    results.append(part_done)
+            completed = all(results)
+        finally:
+            # A full-size file with gaps would look like a finished .part to the
+            # resuming fallback methods
+            if not completed:
+                try:
+                    os.remove(part_filename)
+                except OSError:
+                    pass
+        
+        return completed
+    
+    def download_file(self, url: str, filename: str, page_url: str = "",
+                      confirm_overwrite: bool = True) -> bool:
         """
         Download file from URL with progress bar.
         
@@ -863,73 +1528,65 @@ class AudioDownloader:
             url: Direct URL to the audio file
             filename: Local filename to save as
             page_url: Original webpage URL for referer header
+            confirm_overwrite: Ask before replacing an existing file
             
         Returns:
             True if download successful, False otherwise
         """
         try:
-            # Check if file already exists
-            if os.path.exists(filename):
+            part_filename = filename + _PART_SUFFIX
+            
+            # Check if file (or an unfinished download of it) already exists
+            if confirm_overwrite and (os.path.exists(filename) or os.path.exists(part_filename)):
                 print(f"File already exists: {filename}")
                 response = input("Overwrite? (y/N): ").strip().lower()
                 if response != 'y':
                     return False
             
-            print(f"Downloading: {url}")
-            
-            # Prepare headers for file download
-            download_headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': '*/*',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Sec-Fetch-Dest': 'audio',
-                'Sec-Fetch-Mode': 'no-cors',
-                'Sec-Fetch-Site': 'cross-site',
-                'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-                'sec-ch-ua-mobile': '?0',
-                'sec-ch-ua-platform': '"Windows"'
-            }
-            
-            # Add referer if page URL is provided
-            if page_url:
-                download_headers['Referer'] = page_url
-                download_headers['Origin'] = '/'.join(page_url.split('/')[:3])
-            
-            # Get file size for progress bar
-            try:
-                head_response = self.session.head(url, headers=download_headers, timeout=30)
-                total_size = int(head_response.headers.get('content-length', 0))
-            except:
-                # If HEAD request fails, proceed without size info
-                total_size = 0
-            
-            # Download with progress bar
-            response = self.session.get(url, headers=download_headers, stream=True, timeout=30)
+            logger.info(f"Downloading: {url}")
+            
+            # Download with progress bar, checking first whether ranges are worth it
+            response = self.request_download(url, page_url, probe_ranges=True)
             response.raise_for_status()
             
-            with open(filename, 'wb') as file, tqdm(
+            # Get file size for progress bar (0 if the server doesn't send it)
+            total_size = self.file_size(response)
+            
+            # Large files go over several connections at once when the server allows it
+            ranged = self.supports_ranges(response)
+            with tqdm(
                 desc=os.path.basename(filename),
                 total=total_size,
                 unit='B',
                 unit_scale=True,
                 unit_divisor=1024,
             ) as progress_bar:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        file.write(chunk)
-                        progress_bar.update(len(chunk))
-            
-            print(f"✓ Successfully downloaded: {filename}")
+                if ranged:
+                    ranged = self.download_ranges(url, part_filename, total_size,
+                                                  response.request.headers, progress_bar.update)
+                    if not ranged:
+                        # download_ranges also gives up when a stop was requested
+                        if self.stop_event.is_set():
+                            raise ValueError("Download stopped by user")
+                        # The server ignored Range after all; fetch it as one stream
+                        progress_bar.reset()
+                        response = self.request_download(url, page_url)
+                        response.raise_for_status()
+                if not ranged:
+                    with open(part_filename, 'wb') as file:
+                        # Reserved in full up front, then filled from the stream
+                        stream_to_file(response, file, progress_bar.update, self.stop_event,
+                                       reserve=total_size)
+            os.replace(part_filename, filename)
+            
+            logger.info(f"✓ Successfully downloaded: {filename}")
             return True
             
         except requests.RequestException as e:
-            print(f"✗ Download failed: {e}")
+            logger.warning(f"✗ Download failed: {e}")
             return False
         except Exception as e:
-            print(f"✗ Error during download: {e}")
+            logger.warning(f"✗ Error during download: {e}")
             return False
     
     def download_file_alternative(self, url: str, filename: str, page_url: str = "") -> bool:
@@ -945,65 +1602,156 @@ class AudioDownloader:
             True if download successful, False otherwise
         """
         try:
-            import time
-            
-            print(f"Alternative download: {url}")
+            logger.info(f"Alternative download: {url}")
             
             # Create a new session with different settings
-            alt_session = requests.Session()
-            alt_session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0',
-                'Accept': 'audio/webm,audio/ogg,audio/wav,audio/*;q=0.9,application/ogg;q=0.7,video/*;q=0.6,*/*;q=0.5',
-                'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Range': 'bytes=0-',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Sec-Fetch-Dest': 'audio',
-                'Sec-Fetch-Mode': 'no-cors',
-                'Sec-Fetch-Site': 'cross-site',
-                'Pragma': 'no-cache',
-                'Cache-Control': 'no-cache'
-            })
+            alt_session = self._new_session()
+            alt_session.headers.update(_ALTERNATIVE_HEADERS)
             
             if page_url:
                 alt_session.headers['Referer'] = page_url
-                alt_session.headers['Origin'] = '/'.join(page_url.split('/')[:3])
+                alt_session.headers['Origin'] = _origin(page_url)
             
             # First, make a request to the page to establish context
             if page_url:
                 try:
                     alt_session.get(page_url, timeout=15)
-                    time.sleep(0.5)
+                    self.stop_event.wait(0.5)
                 except:
                     pass
             
-            # Try downloading with range request
-            response = alt_session.get(url, stream=True, timeout=30)
+            # Try downloading with range request, resuming after any partial earlier attempt
+            part_filename = filename + _PART_SUFFIX
+            offset = _partial_size(part_filename)
+            range_headers = {'Range': f'bytes={offset}-'}
+            if offset:
+                # Byte ranges must refer to the unencoded file
+                range_headers['Accept-Encoding'] = 'identity'
+            response = alt_session.get(url, headers=range_headers, stream=True, timeout=30)
+            if response.status_code == 416:
+                # The .part is no shorter than the file itself; start over
+                response.close()
+                offset = 0
+                response = alt_session.get(url, headers={'Range': 'bytes=0-'}, stream=True, timeout=30)
             response.raise_for_status()
             
-            # Get file size
+            # Append only if the server actually honoured the range
+            offset = offset if response.status_code == 206 else 0
             total_size = int(response.headers.get('content-length', 0))
             
-            with open(filename, 'wb') as file, tqdm(
+            with open(part_filename, 'ab' if offset else 'wb') as file, tqdm(
                 desc=f"ALT: {os.path.basename(filename)}",
-                total=total_size,
+                initial=offset,
+                total=offset + total_size,
                 unit='B',
                 unit_scale=True,
                 unit_divisor=1024,
             ) as progress_bar:
-                for chunk in response.iter_content(chunk_size=4096):
-                    if chunk:
-                        file.write(chunk)
-                        progress_bar.update(len(chunk))
+                stream_to_file(response, file, progress_bar.update, self.stop_event)
+            os.replace(part_filename, filename)
             
-            print(f"✓ Alternative download successful: {filename}")
+            logger.info(f"✓ Alternative download successful: {filename}")
             return True
             
         except Exception as e:
-            print(f"✗ Alternative download failed: {e}")
+            logger.warning(f"✗ Alternative download failed: {e}")
             return False
 
+    def _download_with_fallbacks(self, audio_url: str, filepath: str, page_url: str,
+                                 format_type: str, position: str = "") -> bool:
+        """
+        Download one audio file, falling back to the alternative methods on failure.
+        
+        Args:
+            audio_url: Direct URL to the audio file
+            filepath: Local path to save as (overwrite already confirmed)
+            page_url: Original webpage URL for referer header
+            format_type: Audio format, used in log messages
+            position: Optional "[i/N]" prefix for log messages
+            
+        Returns:
+            True if any download method succeeded
+        """
+        logger.info(f"\n{position} Format: {format_type.upper()}")
+        success = self.download_file(audio_url, filepath, page_url, confirm_overwrite=False)
+        
+        if not success:
+            logger.info(f"Skipping {format_type.upper()} download")
+            # Try alternative download method
+            logger.info("Trying alternative download method...")
+            success = self.download_file_alternative(audio_url, filepath, page_url)
+            if success:
+                logger.info(f"✓ Alternative method succeeded for {format_type.upper()}")
+            else:
+                # Final attempt with browser simulation
+                logger.info("Trying final browser simulation method...")
+                success = self.download_file_browser_sim(audio_url, filepath, page_url)
+                if success:
+                    logger.info(f"✓ Browser simulation method succeeded for {format_type.upper()}")
+                else:
+                    logger.error(f"✗ All download methods failed for {format_type.upper()}")
+        
+        return success
+
+    def _analyze_page(self, page_url: str, stop_callback=None) -> Tuple[str, List[Tuple[str, str]]]:
+        """
+        Find the audio files on a webpage and the title to name them after.
+        
+        Args:
+            page_url: URL of the webpage containing audio
+            stop_callback: Optional callback function that returns True if download should stop
+            
+        Returns:
+            Tuple of (base_title, unique (audio_url, format_type) pairs)
+        """
+        logger.info(f"Analyzing webpage: {page_url}")
+        
+        # Establish session first
+        self.establish_session(page_url)
+        
+        # Extract audio URLs
+        audio_urls = self.extract_audio_urls(page_url, stop_callback)
+        logger.info(f"Found {len(audio_urls)} audio source(s)")
+        
+        # Extract title for filename
+        base_title = self.extract_title(page_url)
+        
+        # Remove duplicates while preserving order (dicts keep first-insertion order)
+        unique_audio_urls = list({audio_url: (audio_url, format_type)
+                                  for audio_url, format_type in audio_urls}.values())
+        
+        logger.info(f"Unique audio files to download: {len(unique_audio_urls)}")
+        return base_title, unique_audio_urls
+
+    def _plan_downloads(self, base_title: str, unique_audio_urls: List[Tuple[str, str]],
+                        output_dir: str) -> List[Tuple[str, str, str, str]]:
+        """
+        Work out the target files, asking about overwrites before any download starts.
+        
+        Args:
+            base_title: Page title used as the base filename
+            unique_audio_urls: (audio_url, format_type) pairs found on the page
+            output_dir: Directory to save downloaded files
+            
+        Returns:
+            List of (position, audio_url, format_type, filepath) jobs
+        """
+        jobs = []
+        for i, (audio_url, format_type) in enumerate(unique_audio_urls):
+            if len(unique_audio_urls) > 1:
+                filename = f"{base_title}_{i+1}.{format_type}"
+            else:
+                filename = f"{base_title}.{format_type}"
+            
+            filepath = os.path.join(output_dir, filename)
+            
+            if os.path.exists(filepath) or os.path.exists(filepath + _PART_SUFFIX):
+                print(f"File already exists: {filepath}")
+                if input("Overwrite? (y/N): ").strip().lower() != 'y':
+                    continue
+            jobs.append((f"[{i+1}/{len(unique_audio_urls)}]", audio_url, format_type, filepath))
+        return jobs
+
     def download_from_url(self, page_url: str, output_dir: str = "downloads", stop_callback=None) -> None:
         """
         Main method to download audio from a webpage URL.
@@ -1017,62 +1765,71 @@ class AudioDownloader:
             # Create output directory
             Path(output_dir).mkdir(exist_ok=True)
             
-            print(f"Analyzing webpage: {page_url}")
-            
-            # Establish session first
-            self.establish_session(page_url)
-            
-            # Extract audio URLs
-            audio_urls = self.extract_audio_urls(page_url, stop_callback)
-            print(f"Found {len(audio_urls)} audio source(s)")
+            base_title, unique_audio_urls = self._analyze_page(page_url, stop_callback)
+            jobs = self._plan_downloads(base_title, unique_audio_urls, output_dir)
             
-            # Extract title for filename
-            base_title = self.extract_title(page_url)
+            # Download the audio files concurrently
+            if jobs:
+                with ThreadPoolExecutor(max_workers=min(_DOWNLOAD_WORKERS, len(jobs))) as executor:
+                    futures = [executor.submit(self._download_with_fallbacks, audio_url, filepath,
+                                               page_url, format_type, position)
+                               for position, audio_url, format_type, filepath in jobs]
+                    for future in futures:
+                        future.result()
             
-            # Remove duplicates while preserving order
-            seen_urls = set()
-            unique_audio_urls = []
-            for audio_url, format_type in audio_urls:
-                if audio_url not in seen_urls:
-                    seen_urls.add(audio_url)
-                    unique_audio_urls.append((audio_url, format_type))
-            
-            print(f"Unique audio files to download: {len(unique_audio_urls)}")
-            
-            # Download each audio file
-            for i, (audio_url, format_type) in enumerate(unique_audio_urls):
-                if len(unique_audio_urls) > 1:
-                    filename = f"{base_title}_{i+1}.{format_type}"
-                else:
-                    filename = f"{base_title}.{format_type}"
-                
-                filepath = os.path.join(output_dir, filename)
-                
-                print(f"\n[{i+1}/{len(unique_audio_urls)}] Format: {format_type.upper()}")
-                success = self.download_file(audio_url, filepath, page_url)
-                
-                if not success:
-                    print(f"Skipping {format_type.upper()} download")
-                    # Try alternative download method
-                    print("Trying alternative download method...")
-                    success = self.download_file_alternative(audio_url, filepath, page_url)
-                    if success:
-                        print(f"✓ Alternative method succeeded for {format_type.upper()}")
-                    else:
-                        # Final attempt with browser simulation
-                        print("Trying final browser simulation method...")
-                        success = self.download_file_browser_sim(audio_url, filepath, page_url)
-                        if success:
-                            print(f"✓ Browser simulation method succeeded for {format_type.upper()}")
-                        else:
-                            print(f"✗ All download methods failed for {format_type.upper()}")
-            
-            print(f"\n✓ 오디오 파일 다운로드 완료!")
+            logger.info(f"\n✓ 오디오 파일 다운로드 완료!")
             
         except Exception as e:
-            print(f"✗ Error: {e}")
+            logger.error(f"✗ Error: {e}")
             sys.exit(1)
 
+    def download_batch(self, page_urls: List[str], output_dir: str = "downloads",
+                       concurrency: int = 4, stop_callback=None) -> None:
+        """
+        Download audio from several webpages, analyzing pages while earlier files download.
+        
+        Args:
+            page_urls: URLs of the webpages containing audio
+            output_dir: Directory to save downloaded files
+            concurrency: Number of pages analyzed at the same time
+            stop_callback: Optional callback function that returns True if download should stop
+        """
+        # Create output directory
+        Path(output_dir).mkdir(exist_ok=True)
+        
+        failed_pages = []
+        with ThreadPoolExecutor(max_workers=concurrency) as page_executor, \
+                ThreadPoolExecutor(max_workers=_DOWNLOAD_WORKERS) as download_executor:
+            # Visit every site once up front, so the page analyses below start with its cookies
+            self.establish_sessions(page_urls, page_executor)
+            
+            analyses = {page_executor.submit(self._analyze_page, page_url, stop_callback): page_url
+                        for page_url in page_urls}
+            
+            # Queue each page's files as soon as its analysis finishes; overwrite prompts
+            # stay on this thread so they never interleave
+            downloads = []
+            for future in as_completed(analyses):
+                page_url = analyses[future]
+                try:
+                    base_title, unique_audio_urls = future.result()
+                except Exception as e:
+                    logger.error(f"✗ Error: {page_url}: {e}")
+                    failed_pages.append(page_url)
+                    continue
+                
+                for position, audio_url, format_type, filepath in self._plan_downloads(
+                        base_title, unique_audio_urls, output_dir):
+                    downloads.append(download_executor.submit(
+                        self._download_with_fallbacks, audio_url, filepath, page_url, format_type, position))
+            
+            for future in downloads:
+                future.result()
+        
+        logger.info(f"\n✓ 오디오 파일 다운로드 완료! ({len(page_urls) - len(failed_pages)}/{len(page_urls)} 페이지)")
+        for page_url in failed_pages:
+            logger.error(f"  ✗ {page_url}")
+
 
     def download_file_browser_sim(self, url: str, filename: str, page_url: str = "") -> bool:
         """
@@ -1087,48 +1844,39 @@ class AudioDownloader:
             True if download successful, False otherwise
         """
         try:
-            print(f"Browser simulation download: {url}")
+            logger.info(f"Browser simulation download: {url}")
             
-            # Create completely new session
-            browser_session = requests.Session()
+            # Create completely new session (fresh cookies, pooled connections)
+            browser_session = self._new_session()
             
             # Simulate browser startup sequence
             if page_url:
                 # Visit main domain first
-                domain = '/'.join(page_url.split('/')[:3])
+                domain = _origin(page_url)
                 try:
                     browser_session.get(domain, timeout=10)
-                    time.sleep(0.3)
+                    self.stop_event.wait(0.3)
                 except:
                     pass
                 
                 # Visit the actual page
                 try:
                     browser_session.get(page_url, timeout=15)
-                    time.sleep(0.5)
+                    self.stop_event.wait(0.5)
                 except:
                     pass
             
             # Set headers that exactly match a real browser request
-            browser_headers = {
-                'Accept': '*/*',
-                'Accept-Encoding': 'identity;q=1, *;q=0',
-                'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Cache-Control': 'no-cache',
-                'Connection': 'keep-alive',
-                'DNT': '1',
-                'Host': urlparse(url).netloc,
-                'Pragma': 'no-cache',
-                'Range': 'bytes=0-',
-                'Sec-Fetch-Dest': 'audio',
-                'Sec-Fetch-Mode': 'no-cors',
-                'Sec-Fetch-Site': 'cross-site',
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            }
+            browser_headers = {**_BROWSER_SIM_HEADERS, 'Host': urlsplit(url).netloc}
             
             if page_url:
                 browser_headers['Referer'] = page_url
-                browser_headers['Origin'] = '/'.join(page_url.split('/')[:3])
+                browser_headers['Origin'] = _origin(page_url)
+            
+            # Resume after any partial earlier attempt
+            part_filename = filename + _PART_SUFFIX
+            offset = _partial_size(part_filename)
+            browser_headers['Range'] = f'bytes={offset}-'
             
             # Make request with exact browser headers
             response = browser_session.get(
@@ -1138,35 +1886,41 @@ class AudioDownloader:
                 timeout=30,
                 allow_redirects=True
             )
+            if response.status_code == 416:
+                # The .part is no shorter than the file itself; start over
+                response.close()
+                offset = 0
+                browser_headers['Range'] = 'bytes=0-'
+                response = browser_session.get(url, headers=browser_headers, stream=True,
+                                               timeout=30, allow_redirects=True)
             response.raise_for_status()
             
             # Check if we got the actual file
             content_type = response.headers.get('content-type', '').lower()
             if 'text/html' in content_type:
-                print("⚠ Received HTML instead of audio file - access may be blocked")
+                logger.warning("⚠ Received HTML instead of audio file - access may be blocked")
                 return False
             
-            # Get file size
+            # Append only if the server actually honoured the range
+            offset = offset if response.status_code == 206 else 0
             total_size = int(response.headers.get('content-length', 0))
             
-            with open(filename, 'wb') as file, tqdm(
+            with open(part_filename, 'ab' if offset else 'wb') as file, tqdm(
                 desc=f"SIM: {os.path.basename(filename)}",
-                total=total_size,
+                initial=offset,
+                total=offset + total_size,
                 unit='B',
                 unit_scale=True,
                 unit_divisor=1024,
             ) as progress_bar:
-                for chunk in response.iter_content(chunk_size=2048):
-                    if chunk:
-                        file.write(chunk)
-                        progress_bar.update(len(chunk))
-                        time.sleep(0.001)  # Tiny delay to mimic real browser
+                stream_to_file(response, file, progress_bar.update, self.stop_event)
+            os.replace(part_filename, filename)
             
-            print(f"✓ Browser simulation download successful: {filename}")
+            logger.info(f"✓ Browser simulation download successful: {filename}")
             return True
             
         except Exception as e:
-            print(f"✗ Browser simulation download failed: {e}")
+            logger.warning(f"✗ Browser simulation download failed: {e}")
             return False
 
 
@@ -1176,27 +1930,36 @@ def main() -> None:
     print("=" * 40)
     
     if len(sys.argv) > 1:
-        url = sys.argv[1]
+        urls = sys.argv[1:]
     else:
-        url = input("Enter the webpage URL: ").strip()
+        urls = [input("Enter the webpage URL: ").strip()]
     
-    if not url:
+    if not all(urls):
         print("Error: No URL provided")
         sys.exit(1)
     
     # Validate URL format
-    if not url.startswith(('http://', 'https://')):
-        print("Error: Please provide a valid HTTP/HTTPS URL")
-        sys.exit(1)
+    for url in urls:
+        if not url.startswith(('http://', 'https://')):
+            print(f"Error: Please provide a valid HTTP/HTTPS URL: {url}")
+            sys.exit(1)
     
     # Get output directory
     output_dir = input("Enter output directory (default: downloads): ").strip()
     if not output_dir:
         output_dir = "downloads"
     
+    # Progress messages go through logging; route them above the tqdm bars
+    logging.basicConfig(format='%(message)s')
+    logger.setLevel(logging.INFO)
+    
     # Initialize downloader and start download
     downloader = AudioDownloader()
-    downloader.download_from_url(url, output_dir)
+    with logging_redirect_tqdm():
+        if len(urls) == 1:
+            downloader.download_from_url(urls[0], output_dir)
+        else:
+            downloader.download_batch(urls, output_dir)
     
     print("\n✓ Download process completed!")
 
@@ -6,16 +6,147 @@ A modern GUI interface for downloading MP3/M4A files from japaneseasmr.com
 """
 
 import os
+import re
 import sys
+import time
+import logging
 import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from pathlib import Path
 import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import MappingProxyType
 from typing import Optional
+from urllib.parse import urlsplit
 
 # Import our existing downloader
-from audio_downloader import AudioDownloader
+from audio_downloader import AudioDownloader, stream_to_file
+
+# Oldest log lines are dropped beyond this so the log widget stays fast
+_MAX_LOG_LINES = 2000
+
+# Most queued UI updates applied per 50 ms tick
+_QUEUE_BATCH_SIZE = 200
+
+# Minimum seconds between progress updates of a download (~10 Hz)
+_PROGRESS_INTERVAL = 0.1
+
+# Pages analyzed at the same time, and files downloaded at the same time (across all pages)
+_PAGE_WORKERS = 3
+_DOWNLOAD_WORKERS = 4
+
+# Schemes accepted for page URLs
+_HTTP_PREFIXES = ('http://', 'https://')
+
+# Start of each URL when several were pasted into one line
+_SCHEME_PATTERN = re.compile(r'https?://')
+
+# A URL anywhere in the URL box
+_URL_PATTERN = re.compile(r'https?://\S+')
+
+# Custom red/dark colors
+_COLORS = MappingProxyType({
+    'bg_dark': '#1a0d0d',      # Very dark red background
+    'bg_medium': '#2d1515',     # Medium dark red
+    'bg_light': '#3d1f1f',      # Lighter dark red
+    'primary': '#cc2936',       # Bright red
+    'secondary': '#e74c3c',     # Orange-red
+    'accent': '#ff6b6b',        # Light red/pink
+    'success': '#27ae60',       # Green for success
+    'warning': '#f39c12',       # Orange for warning
+    'text_light': '#ffffff',    # White text
+    'text_dark': '#2c3e50',     # Dark text
+    'border': '#5d2c2c'         # Red border
+})
+
+
+def _configure_styles(style: ttk.Style) -> None:
+    """Set up the clam theme and the red ttk widget styles."""
+    if style.theme_use() != 'clam':
+        style.theme_use('clam')
+    
+    # Configure custom styles
+    
+    # Frame styles
+    style.configure('Dark.TFrame', 
+                   background=_COLORS['bg_dark'],
+                   relief='flat',
+                   borderwidth=0)
+    
+    style.configure('Medium.TFrame', 
+                   background=_COLORS['bg_dark'],  # Changed to match main background
+                   relief='flat',  # Changed from raised to flat
+                   borderwidth=0)  # Removed border
+    
+    # Label styles - all using bg_dark to match window
+    style.configure('Title.TLabel',
+                   background=_COLORS['bg_dark'],
+                   foreground=_COLORS['accent'],
+                   font=('Helvetica', 18, 'bold'))
+    
+    style.configure('Heading.TLabel',
+                   background=_COLORS['bg_dark'],
+                   foreground=_COLORS['text_light'],
+                   font=('Helvetica', 11, 'bold'))
+    
+    style.configure('Info.TLabel',
+                   background=_COLORS['bg_dark'],
+                   foreground=_COLORS['text_light'],
+                   font=('Helvetica', 9))
+    
+    style.configure('Status.TLabel',
+                   background=_COLORS['bg_dark'],  # Changed to match background
+                   foreground=_COLORS['text_light'],
+                   font=('Helvetica', 8),
+                   relief='flat',  # Changed from sunken to flat
+                   padding=(5, 2))
+    
+    # Button styles
+    style.configure('Primary.TButton',
+                   background=_COLORS['primary'],
+                   foreground=_COLORS['text_light'],
+                   font=('Helvetica', 10, 'bold'),
+                   padding=(15, 8),
+                   relief='raised',
+                   borderwidth=2)
+    
+    style.map('Primary.TButton',
+             background=[('active', _COLORS['secondary']),
+                        ('pressed', _COLORS['accent'])])
+    
+    style.configure('Secondary.TButton',
+                   background=_COLORS['bg_light'],
+                   foreground=_COLORS['text_light'],
+                   font=('Helvetica', 9),
+                   padding=(10, 5),
+                   relief='raised',
+                   borderwidth=1)
+    
+    style.map('Secondary.TButton',
+             background=[('active', _COLORS['border']),
+                        ('pressed', _COLORS['bg_medium'])])
+    
+    style.configure('Stop.TButton',
+                   background=_COLORS['warning'],
+                   foreground=_COLORS['text_dark'],
+                   font=('Helvetica', 10, 'bold'),
+                   padding=(15, 8),
+                   relief='raised',
+                   borderwidth=2)
+    
+    style.map('Stop.TButton',
+             background=[('active', '#e67e22'),
+                        ('pressed', '#d35400')])
+    
+    # Progress bar style
+    style.configure('Red.Horizontal.TProgressbar',
+                   background=_COLORS['primary'],
+                   troughcolor=_COLORS['bg_light'],
+                   borderwidth=1,
+                   lightcolor=_COLORS['accent'],
+                   darkcolor=_COLORS['secondary'])
 
 
 class AudioDownloaderGUI:
@@ -25,9 +156,34 @@ class AudioDownloaderGUI:
         """Initialize the GUI application."""
         self.root = tk.Tk()
         self.downloader = AudioDownloader()
+        # UI updates posted from the download thread, applied on the Tk thread by _process_queue
         self.download_queue = queue.Queue()
         self.is_downloading = False
-        self.stop_download = False
+        # Shared with the downloader so one set() also interrupts its retries and waits
+        self.stop_event = self.downloader.stop_event
+        
+        # Log lines waiting for the next batched write to the log widget (only the Tk
+        # thread touches it; lines past the widget's cap would be trimmed anyway)
+        self._log_buffer = deque(maxlen=_MAX_LOG_LINES)
+        
+        # Bytes expected and received across all downloads of the current run
+        self._bytes_total = 0
+        self._bytes_done = 0
+        
+        # Thread pools kept for the life of the window, so later runs reuse their threads:
+        # one for download_worker itself, one for page analysis and one for file downloads
+        self._run_executor = ThreadPoolExecutor(max_workers=1)
+        self._page_executor = ThreadPoolExecutor(max_workers=_PAGE_WORKERS)
+        self._download_executor = ThreadPoolExecutor(max_workers=_DOWNLOAD_WORKERS)
+        
+        # origin -> randomized file-request headers, drawn once per site
+        self._site_headers = {}
+        
+        # Download methods (see _download_one) in the order to try them; the one that
+        # last succeeded moves to the front. Files download on several threads, so the
+        # order is only replaced under the lock, and always as a new tuple
+        self._method_order = (0, 1, 2)
+        self._method_order_lock = threading.Lock()
         
         # Set automatic download directory
         # Handle both script and EXE execution
@@ -45,6 +201,9 @@ class AudioDownloaderGUI:
         self.create_widgets()
         self.setup_bindings()
         
+        # Start applying queued UI updates
+        self._process_queue()
+        
     def setup_window(self) -> None:
         """Configure the main window."""
         self.root.title("🎵 Japanese ASMR Audio Downloader")
@@ -54,112 +213,13 @@ class AudioDownloaderGUI:
         # Set window background to dark red
         self.root.configure(bg='#1a0d0d')
         
-        # Set window icon (if available)
-        try:
-            # You can add an icon file here if you have one
-            pass
-        except:
-            pass
-            
-        # Configure style with red theme
-        style = ttk.Style()
-        style.theme_use('clam')
-        
         # Custom red/dark colors
-        self.colors = {
-            'bg_dark': '#1a0d0d',      # Very dark red background
-            'bg_medium': '#2d1515',     # Medium dark red
-            'bg_light': '#3d1f1f',      # Lighter dark red
-            'primary': '#cc2936',       # Bright red
-            'secondary': '#e74c3c',     # Orange-red
-            'accent': '#ff6b6b',        # Light red/pink
-            'success': '#27ae60',       # Green for success
-            'warning': '#f39c12',       # Orange for warning
-            'text_light': '#ffffff',    # White text
-            'text_dark': '#2c3e50',     # Dark text
-            'border': '#5d2c2c'         # Red border
-        }
+        self.colors = _COLORS
         
-        # Configure custom styles
-        
-        # Frame styles
-        style.configure('Dark.TFrame', 
-                       background=self.colors['bg_dark'],
-                       relief='flat',
-                       borderwidth=0)
-        
-        style.configure('Medium.TFrame', 
-                       background=self.colors['bg_dark'],  # Changed to match main background
-                       relief='flat',  # Changed from raised to flat
-                       borderwidth=0)  # Removed border
-        
-        # Label styles - all using bg_dark to match window
-        style.configure('Title.TLabel',
-                       background=self.colors['bg_dark'],
-                       foreground=self.colors['accent'],
-                       font=('Helvetica', 18, 'bold'))
-        
-        style.configure('Heading.TLabel',
-                       background=self.colors['bg_dark'],
-                       foreground=self.colors['text_light'],
-                       font=('Helvetica', 11, 'bold'))
-        
-        style.configure('Info.TLabel',
-                       background=self.colors['bg_dark'],
-                       foreground=self.colors['text_light'],
-                       font=('Helvetica', 9))
-        
-        style.configure('Status.TLabel',
-                       background=self.colors['bg_dark'],  # Changed to match background
-                       foreground=self.colors['text_light'],
-                       font=('Helvetica', 8),
-                       relief='flat',  # Changed from sunken to flat
-                       padding=(5, 2))
-        
-        # Button styles
-        style.configure('Primary.TButton',
-                       background=self.colors['primary'],
-                       foreground=self.colors['text_light'],
-                       font=('Helvetica', 10, 'bold'),
-                       padding=(15, 8),
-                       relief='raised',
-                       borderwidth=2)
-        
-        style.map('Primary.TButton',
-                 background=[('active', self.colors['secondary']),
-                            ('pressed', self.colors['accent'])])
-        
-        style.configure('Secondary.TButton',
-                       background=self.colors['bg_light'],
-                       foreground=self.colors['text_light'],
-                       font=('Helvetica', 9),
-                       padding=(10, 5),
-                       relief='raised',
-                       borderwidth=1)
-        
-        style.map('Secondary.TButton',
-                 background=[('active', self.colors['border']),
-                            ('pressed', self.colors['bg_medium'])])
-        
-        style.configure('Stop.TButton',
-                       background=self.colors['warning'],
-                       foreground=self.colors['text_dark'],
-                       font=('Helvetica', 10, 'bold'),
-                       padding=(15, 8),
-                       relief='raised',
-                       borderwidth=2)
-        
-        style.map('Stop.TButton',
-                 background=[('active', '#e67e22'),
-                            ('pressed', '#d35400')])
-        
-        # Progress bar style
-        style.configure('Red.Horizontal.TProgressbar',
-                       background=self.colors['primary'],
-                       troughcolor=self.colors['bg_light'],
-                       borderwidth=1,
-                       lightcolor=self.colors['accent'],
-                       darkcolor=self.colors['secondary'])
+        # Configure style with red theme, unless this Tk interpreter already has it
+        style = ttk.Style(self.root)
+        if style.lookup('Dark.TFrame', 'background') != _COLORS['bg_dark']:
+            _configure_styles(style)
         
         # Entry/Text widget styling (will be applied via configure)
         self.text_style = {
@@ -177,6 +237,9 @@ class AudioDownloaderGUI:
         
     def create_widgets(self) -> None:
         """Create and arrange GUI widgets."""
+        # Keep the window hidden while building so the layout is computed once, not per widget
+        self.root.withdraw()
+        
         # Main container with dark theme
         main_frame = ttk.Frame(self.root, padding="25", style='Dark.TFrame')
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -280,7 +343,7 @@ class AudioDownloaderGUI:
         # Enhanced progress bar
         self.progress_bar = ttk.Progressbar(
             progress_container,
-            mode='indeterminate',
+            mode='determinate',
             length=500,
             style='Red.Horizontal.TProgressbar'
         )
@@ -333,12 +396,22 @@ class AudioDownloaderGUI:
         )
         version_label.grid(row=0, column=2, padx=(0, 10))
         
+        # Lay everything out in one pass, then show the finished window
+        self.root.update_idletasks()
+        self.root.deiconify()
+        
     def setup_bindings(self) -> None:
         """Setup event bindings."""
         # Allow paste with Ctrl+V
         self.url_text.bind('<Control-v>', self.paste_url)
         self.url_text.bind('<Button-3>', self.show_context_menu)
         
+        # Context menu for the URL entry, built once and reused on every right-click
+        self.context_menu = tk.Menu(self.root, tearoff=0)
+        self.context_menu.add_command(label="붙여넣기", command=self.paste_url)
+        self.context_menu.add_command(label="전체 선택", command=lambda: self.url_text.select_range(1.0, tk.END))
+        self.context_menu.add_command(label="지우기", command=self.clear_url)
+        
         # Enter key to start download
         self.url_text.bind('<Return>', lambda e: self.start_download())
         
@@ -347,30 +420,25 @@ class AudioDownloaderGUI:
         
     def paste_url(self, event=None) -> None:
         """Handle URL paste."""
+        # Tk raises TclError when the clipboard is empty or holds no text
         try:
             clipboard = self.root.clipboard_get()
-            if clipboard.startswith(('http://', 'https://')):
-                # Clear the current content first to prevent duplication
-                self.url_text.delete(1.0, tk.END)
-                self.url_text.insert(tk.END, clipboard.strip())
-                self.log_message(f"URL 붙여넣기 완료: {clipboard[:50]}...")
-                # Return "break" to prevent default tkinter paste behavior
-                return "break"
-        except Exception as e:
-            self.log_message(f"붙여넣기 오류: {str(e)}")
+        except tk.TclError:
+            return "break"
+        
+        if clipboard.startswith(_HTTP_PREFIXES):
+            # Clear the current content first to prevent duplication
+            self.url_text.delete(1.0, tk.END)
+            self.url_text.insert(tk.END, clipboard.strip())
+            self.log_message(f"URL 붙여넣기 완료: {clipboard[:50]}...")
         return "break"  # Always prevent default paste behavior
             
     def show_context_menu(self, event) -> None:
         """Show context menu for URL entry."""
-        context_menu = tk.Menu(self.root, tearoff=0)
-        context_menu.add_command(label="붙여넣기", command=self.paste_url)
-        context_menu.add_command(label="전체 선택", command=lambda: self.url_text.select_range(1.0, tk.END))
-        context_menu.add_command(label="지우기", command=self.clear_url)
-        
         try:
-            context_menu.tk_popup(event.x_root, event.y_root)
+            self.context_menu.tk_popup(event.x_root, event.y_root)
         finally:
-            context_menu.grab_release()
+            self.context_menu.grab_release()
             
     def clear_url(self) -> None:
         """Clear the URL entry."""
@@ -378,37 +446,89 @@ class AudioDownloaderGUI:
         self.url_text.focus()
         
     def log_message(self, message: str) -> None:
-        """Add message to log."""
+        """Add message to log (safe to call from any thread)."""
+        self.download_queue.put(('log', message))
+    
+    def _process_queue(self) -> None:
+        """Apply the UI updates posted to download_queue, then reschedule."""
+        # A bounded batch per tick keeps the window responsive during log floods
+        for _ in range(_QUEUE_BATCH_SIZE):
+            try:
+                kind, value = self.download_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if kind == 'log':
+                self._log_buffer.append(value)
+            elif kind == 'status':
+                self.status_var.set(value)
+            elif kind == 'progress_text':
+                self.progress_var.set(value)
+            elif kind == 'bytes_total':
+                self._bytes_total += value
+                self.progress_bar['maximum'] = max(self._bytes_total, 1)
+            elif kind == 'bytes':
+                self._bytes_done += value
+                self.progress_bar['value'] = self._bytes_done
+                self.progress_var.set(f"다운로드 중: {self._bytes_done * 100 / max(self._bytes_total, 1):.1f}% "
+                                      f"({self._bytes_done//1024//1024}MB/{self._bytes_total//1024//1024}MB)")
+            elif kind == 'info':
+                self._flush_logs()
+                messagebox.showinfo(*value)
+            elif kind == 'error':
+                self._flush_logs()
+                messagebox.showerror(*value)
+            elif kind == 'done':
+                self._finish_download()
+        
+        self._flush_logs()
+        self.root.after(50, self._process_queue)
+    
+    def _flush_logs(self) -> None:
+        """Write all buffered log lines to the log widget in one insert."""
+        if not self._log_buffer:
+            return
+        batch = list(self._log_buffer)
+        self._log_buffer.clear()
+        
+        # Only follow new lines if the user hasn't scrolled up to read older ones
+        tailing = self.log_text.yview()[1] > 0.999
+        top_line = int(self.log_text.index('@0,0').split('.')[0])
+        
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"{message}\n")
+        self.log_text.insert(tk.END, "\n".join(batch) + "\n")
+        
+        # Drop the oldest lines in one slice once over the cap (the text always
+        # ends with a newline, so the last "line" is empty)
+        line_count = int(self.log_text.index('end-1c').split('.')[0]) - 1
+        trimmed = max(0, line_count - _MAX_LOG_LINES)
+        if trimmed:
+            self.log_text.delete('1.0', f'{trimmed + 1}.0')
         self.log_text.config(state=tk.DISABLED)
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        
+        if tailing:
+            self.log_text.see(tk.END)
+        else:
+            self.log_text.yview(f'{max(1, top_line - trimmed)}.0')
         
     def update_status(self, status: str) -> None:
-        """Update status bar."""
-        self.status_var.set(status)
-        self.root.update_idletasks()
+        """Update status bar (safe to call from any thread)."""
+        self.download_queue.put(('status', status))
         
     def update_progress(self, text: str) -> None:
-        """Update progress text."""
-        self.progress_var.set(text)
-        self.root.update_idletasks()
+        """Update progress text (safe to call from any thread)."""
+        self.download_queue.put(('progress_text', text))
         
     def start_download(self) -> None:
         """Start the download process."""
-        urls = [line.strip() for line in self.url_text.get(1.0, tk.END).splitlines() if line.strip()]
+        raw_text = self.url_text.get(1.0, tk.END)
         
-        # Clean and validate URLs
-        cleaned_urls = []
-        invalid_urls = []
+        # Pick every URL out of the text in one scan, then clean up pasted duplicates
+        cleaned_urls = [self.clean_url(match.group()) for match in _URL_PATTERN.finditer(raw_text)]
         
-        for url in urls:
-            cleaned_url = self.clean_url(url)
-            if cleaned_url and cleaned_url.startswith(('http://', 'https://')):
-                cleaned_urls.append(cleaned_url)
-            elif cleaned_url:
-                invalid_urls.append(cleaned_url)
+        # Lines without any URL are reported (a line holding two URLs doesn't make up for them)
+        lines = [line.strip() for line in raw_text.splitlines() if line.strip()]
+        invalid_urls = [line for line in lines if not _URL_PATTERN.search(line)]
         
         # Show validation results
         if invalid_urls:
@@ -442,30 +562,28 @@ class AudioDownloaderGUI:
             
         # Start download in separate thread
         self.is_downloading = True
-        self.stop_download = False
+        self.stop_event.clear()
         self.download_btn.config(state='disabled', text="다운로드 중...")
         self.stop_btn.config(state='normal')
-        self.progress_bar.start(10)
+        self._bytes_total = 0
+        self._bytes_done = 0
+        self.progress_bar.config(value=0, maximum=1)
         self.update_progress("다운로드 준비 중...")
         self.update_status("다운로드 중...")
         
         # Clear log
+        self._log_buffer.clear()
         self.log_text.config(state=tk.NORMAL)
         self.log_text.delete(1.0, tk.END)
         self.log_text.config(state=tk.DISABLED)
         
-        # Start download thread
-        download_thread = threading.Thread(
-            target=self.download_worker,
-            args=(cleaned_urls, str(self.auto_download_dir)),
-            daemon=True
-        )
-        download_thread.start()
+        # Start download on the worker thread
+        self._run_executor.submit(self.download_worker, cleaned_urls, str(self.auto_download_dir))
         
     def stop_download_process(self) -> None:
         """Stop the download process."""
         if self.is_downloading:
-            self.stop_download = True
+            self.stop_event.set()
             self.log_message("⏹ 사용자가 다운로드를 중지했습니다.")
             self.update_progress("다운로드 중지 중...")
             self.update_status("중지 중...")
@@ -481,201 +599,45 @@ class AudioDownloaderGUI:
         
         # Check for URL duplication (e.g., https://example.com/https://example.com/)
         if url.count('://') > 1:
-            # Find the first occurrence of a valid URL
-            if url.startswith('http://'):
-                # Find the next occurrence of http:// or https://
-                next_http = url.find('http://', 7)
-                next_https = url.find('https://', 7)
-                if next_http != -1 or next_https != -1:
-                    # Take the later URL (which is likely the intended one)
-                    if next_https != -1:
-                        url = url[next_https:]
-                    elif next_http != -1:
-                        url = url[next_http:]
-            elif url.startswith('https://'):
-                # Find the next occurrence of http:// or https://
-                next_http = url.find('http://', 8)
-                next_https = url.find('https://', 8)
-                if next_http != -1 or next_https != -1:
-                    # Take the later URL (which is likely the intended one)
-                    if next_https != -1:
-                        url = url[next_https:]
-                    elif next_http != -1:
-                        url = url[next_http:]
+            # Take the last URL (which is likely the intended one)
+            matches = list(_SCHEME_PATTERN.finditer(url))
+            if matches:
+                url = url[matches[-1].start():]
         
         return url
         
     def download_worker(self, urls: list[str], output_dir: str) -> None:
         """Worker function for downloading in separate thread."""
         try:
-            # Reset stop flag
-            self.stop_download = False
-            
             # Update status
             self.update_status("분석 중...")
             self.update_progress("웹페이지 분석 중...")
             
-            self.log_message(f"총 {len(urls)}개의 URL을 순차적으로 처리합니다...")
+            self.log_message(f"총 {len(urls)}개의 URL을 동시에 처리합니다...")
             self.log_message("")
             
             total_success_count = 0
             total_file_count = 0
             
-            # Process each URL sequentially
-            for url_index, url in enumerate(urls, 1):
-                # Check for stop signal
-                if self.stop_download:
-                    break
-                
-                self.log_message(f"🔗 [{url_index}/{len(urls)}] URL 처리 중: {url}")
-                self.update_progress(f"URL {url_index}/{len(urls)} 분석 중...")
-                
-                try:
-                    # Establish session for each URL
-                    self.log_message("세션 설정 중...")
-                    self.downloader.establish_session(url)
-                    self.log_message("✓ 세션 설정 완료")
-                    
-                    # Check for stop signal
-                    if self.stop_download:
-                        break
-                    
-                    # Extract audio URLs
-                    self.log_message("오디오 URL 추출 중...")
-                    
-                    # Create stop callback function
-                    def stop_callback():
-                        return self.stop_download
-                    
-                    try:
-                        audio_urls = self.downloader.extract_audio_urls(url, stop_callback)
-                        self.log_message(f"발견된 오디오 소스: {len(audio_urls)}개")
-                    except ValueError as e:
-                        if "stopped by user" in str(e).lower():
-                            self.log_message("🛑 사용자에 의해 URL 추출이 중단되었습니다.")
-                            break
-                        else:
-                            # Handle other ValueError (like "No audio URLs found")
-                            self.log_message(f"⚠ URL 추출 오류: {str(e)}")
-                            self.log_message(f"❌ URL {url_index} 건너뛰기")
-                            self.log_message("")
-                            continue
-                    except Exception as e:
-                        # Handle any other unexpected errors
-                        self.log_message(f"✗ 예상치 못한 오류: {str(e)}")
-                        self.log_message(f"❌ URL {url_index} 건너뛰기")
-                        self.log_message("")
-                        continue
-                    
-                    # Check for stop signal
-                    if self.stop_download:
-                        break
-                    
-                    # Extract title for filename
-                    base_title = self.downloader.extract_title(url)
-                    self.log_message(f"제목: {base_title}")
-                    
-                    # Remove duplicates and filter for MP3 only
-                    seen_urls = set()
-                    unique_audio_urls = []
-                    for audio_url, format_type in audio_urls:
-                        if audio_url not in seen_urls and format_type.lower() == 'mp3':
-                            seen_urls.add(audio_url)
-                            unique_audio_urls.append((audio_url, format_type))
-                    
-                    self.log_message(f"✓ 발견된 전체 파일: {len(audio_urls)}개")
-                    self.log_message(f"✓ MP3 파일만 필터링: {len(unique_audio_urls)}개")
-                    
-                    if len(unique_audio_urls) == 0:
-                        self.log_message("⚠ MP3 파일을 찾을 수 없습니다.")
-                        self.log_message(f"❌ URL {url_index} 건너뛰기")
-                        self.log_message("")
-                        continue
-                    
-                    # Check for stop signal
-                    if self.stop_download:
-                        break
-                    
-                    # Download files for this URL
-                    url_success_count = 0
-                    
-                    for i, (audio_url, format_type) in enumerate(unique_audio_urls):
-                        # Check for stop signal before each download
-                        if self.stop_download:
-                            break
-                        
-                        # Generate filename with URL index for multiple URLs
-                        if len(urls) > 1:
-                            filename = f"{base_title}_URL{url_index}"
-                            if len(unique_audio_urls) > 1:
-                                filename += f"_{i+1}"
-                            filename += f".{format_type}"
-                        else:
-                            if len(unique_audio_urls) > 1:
-                                filename = f"{base_title}_{i+1}.{format_type}"
-                            else:
-                                filename = f"{base_title}.{format_type}"
-                        
-                        filepath = os.path.join(output_dir, filename)
-                        
-                        self.log_message("")
-                        self.log_message(f"[URL {url_index}: {i+1}/{len(unique_audio_urls)}] {format_type.upper()} 다운로드 시작: {filename}")
-                        self.update_progress(f"URL {url_index}/{len(urls)}: 파일 {i+1}/{len(unique_audio_urls)} 다운로드 중...")
-                        
-                        success = False
-                        
-                        # Method 1: Standard download
-                        if self.download_file_gui(audio_url, filepath, url):
-                            success = True
-                            url_success_count += 1
-                            total_success_count += 1
-                            self.log_message(f"✓ {format_type.upper()} 다운로드 완료!")
-                        else:
-                            # Check for stop signal
-                            if self.stop_download:
-                                break
-                                
-                            self.log_message(f"첫 번째 방법 실패, 대안 방법 시도 중...")
-                            
-                            # Method 2: Alternative download
-                            if self.download_file_alternative_gui(audio_url, filepath, url):
-                                success = True
-                                url_success_count += 1
-                                total_success_count += 1
-                                self.log_message(f"✓ 대안 방법으로 {format_type.upper()} 다운로드 완료!")
-                            else:
-                                # Check for stop signal
-                                if self.stop_download:
-                                    break
-                                    
-                                self.log_message(f"대안 방법 실패, 브라우저 시뮬레이션 시도 중...")
-                                
-                                # Method 3: Browser simulation
-                                if self.download_file_browser_sim_gui(audio_url, filepath, url):
-                                    success = True
-                                    url_success_count += 1
-                                    total_success_count += 1
-                                    self.log_message(f"✓ 브라우저 시뮬레이션으로 {format_type.upper()} 다운로드 완료!")
-                                else:
-                                    self.log_message(f"✗ 모든 방법으로 {format_type.upper()} 다운로드 실패")
-                        
-                        total_file_count += 1
-                        self.log_message("")
-                    
-                    # Check for stop signal after processing this URL
-                    if self.stop_download:
-                        break
-                    
-                    # Summary for this URL
-                    self.log_message(f"📊 URL {url_index} 완료: {url_success_count}/{len(unique_audio_urls)}개 파일 성공")
-                    self.log_message("")
-                    
-                except Exception as e:
-                    # Handle any unexpected errors for this URL
-                    self.log_message(f"✗ URL {url_index} 처리 중 오류: {str(e)}")
-                    self.log_message(f"❌ URL {url_index} 건너뛰기")
-                    self.log_message("")
+            # Visit every site once up front, all at the same time, so the pages reuse its cookies
+            self.downloader.establish_sessions(urls, self._page_executor)
+            
+            # Analyze several pages at once; all of their files share one download pool
+            futures = [self._page_executor.submit(self._process_url, url_index, url, len(urls),
+                                                  output_dir, self._download_executor)
+                       for url_index, url in enumerate(urls, 1)]
+            
+            for future in as_completed(futures):
+                # Check for stop signal; don't start the pages still waiting
+                if self.stop_event.is_set():
+                    for pending in futures:
+                        pending.cancel()
+                if future.cancelled():
                     continue
+                
+                success_count, file_count = future.result()
+                total_success_count += success_count
+                total_file_count += file_count
             
             # Final status update
             if total_success_count > 0:
@@ -687,18 +649,18 @@ class AudioDownloaderGUI:
                 self.update_status(f"다운로드 완료: {total_success_count}개 파일")
                 
                 # Show completion dialog
-                messagebox.showinfo(
+                self.download_queue.put(('info', (
                     "다운로드 완료", 
                     f"{len(urls)}개 URL 처리 완료!\n\n"
                     f"성공한 파일: {total_success_count}개\n"
                     f"총 파일: {total_file_count}개\n\n"
                     f"저장 위치: {output_dir}"
-                )
+                )))
             else:
                 self.log_message("✗ 모든 다운로드 실패")
                 self.update_progress("실패")
                 self.update_status("다운로드 실패")
-                messagebox.showerror("다운로드 실패", "모든 파일 다운로드에 실패했습니다.")
+                self.download_queue.put(('error', ("다운로드 실패", "모든 파일 다운로드에 실패했습니다.")))
             
         except Exception as e:
             # Handle any unexpected errors that weren't caught above
@@ -706,114 +668,338 @@ class AudioDownloaderGUI:
             self.log_message(f"✗ 예상치 못한 전체 오류 발생: {error_msg}")
             
             # Don't show error dialog if user stopped the download
-            if not self.stop_download and "stopped by user" not in error_msg.lower():
+            if not self.stop_event.is_set() and "stopped by user" not in error_msg.lower():
                 self.update_progress("오류 발생")
                 self.update_status("오류 발생")
-                messagebox.showerror("오류", f"다운로드 중 예상치 못한 오류가 발생했습니다:\n{error_msg}")
-            elif self.stop_download:
+                self.download_queue.put(('error', ("오류", f"다운로드 중 예상치 못한 오류가 발생했습니다:\n{error_msg}")))
+            elif self.stop_event.is_set():
                 self.log_message("🛑 사용자에 의해 다운로드가 중단되었습니다.")
         
         finally:
-            # Re-enable buttons
-            self.download_btn.config(state='normal')
-            self.stop_btn.config(state='disabled')
-            self.is_downloading = False
+            # Widgets are reset on the Tk thread once everything above has been shown
+            self.download_queue.put(('done', None))
+    
+    def _process_url(self, url_index: int, url: str, url_count: int, output_dir: str,
+                     download_executor: ThreadPoolExecutor) -> tuple[int, int]:
+        """Analyze one page and download its MP3 files; returns (succeeded, attempted)."""
+        # Pages are processed concurrently, so tag each line with its URL
+        def log(message: str) -> None:
+            self.log_message(f"[URL {url_index}] {message}" if message else "")
+        
+        # Check for stop signal
+        if self.stop_event.is_set():
+            return 0, 0
+        
+        self.log_message(f"🔗 [{url_index}/{url_count}] URL 처리 중: {url}")
+        self.update_progress(f"URL {url_index}/{url_count} 분석 중...")
+        
+        try:
+            # Establish session for each URL
+            log("세션 설정 중...")
+            self.downloader.establish_session(url)
+            log("✓ 세션 설정 완료")
             
-            # Reset download button text
-            self.download_btn.config(text="🚀 다운로드 시작")
+            # Check for stop signal
+            if self.stop_event.is_set():
+                return 0, 0
             
-            # Stop progress bar animation
-            self.progress_bar.stop()
+            # Extract audio URLs
+            log("오디오 URL 추출 중...")
             
-            # Reset progress bar mode to indeterminate
-            self.progress_bar.config(mode='indeterminate')
+            try:
+                audio_urls = self.downloader.extract_audio_urls(url, self.stop_event.is_set)
+                log(f"발견된 오디오 소스: {len(audio_urls)}개")
+            except ValueError as e:
+                if "stopped by user" in str(e).lower():
+                    log("🛑 사용자에 의해 URL 추출이 중단되었습니다.")
+                else:
+                    # Handle other ValueError (like "No audio URLs found")
+                    log(f"⚠ URL 추출 오류: {str(e)}")
+                    log(f"❌ URL {url_index} 건너뛰기")
+                    log("")
+                return 0, 0
+            except Exception as e:
+                # Handle any other unexpected errors
+                log(f"✗ 예상치 못한 오류: {str(e)}")
+                log(f"❌ URL {url_index} 건너뛰기")
+                log("")
+                return 0, 0
             
-            # Update status to ready if not stopped by user
-            if not self.stop_download:
-                self.update_progress("대기 중...")
-                self.update_status("준비됨")
-            else:
-                self.update_progress("중단됨")
-                self.update_status("사용자 중단")
+            # Check for stop signal
+            if self.stop_event.is_set():
+                return 0, 0
+            
+            # Extract title for filename
+            base_title = self.downloader.extract_title(url)
+            log(f"제목: {base_title}")
+            
+            # Remove duplicates and filter for MP3 only (dicts keep first-insertion order)
+            unique_audio_urls = list({audio_url: (audio_url, format_type)
+                                      for audio_url, format_type in audio_urls
+                                      if format_type == 'mp3'}.values())
+            
+            log(f"✓ 발견된 전체 파일: {len(audio_urls)}개")
+            log(f"✓ MP3 파일만 필터링: {len(unique_audio_urls)}개")
+            
+            if len(unique_audio_urls) == 0:
+                log("⚠ MP3 파일을 찾을 수 없습니다.")
+                log(f"❌ URL {url_index} 건너뛰기")
+                log("")
+                return 0, 0
+            
+            # Check for stop signal
+            if self.stop_event.is_set():
+                return 0, 0
+            
+            # Headers for this page's file requests, built once for all of its files. Every
+            # page of a site gets the same randomized set, so the site sees one browser.
+            page_parts = urlsplit(url)
+            origin = f"{page_parts.scheme}://{page_parts.netloc}"
+            site_headers = self._site_headers.get(origin)
+            if site_headers is None:
+                site_headers = self._site_headers.setdefault(origin, self.downloader.get_random_headers())
+            download_headers = {**site_headers, 'Referer': url, 'Origin': origin}
+            
+            # Filenames get a URL index with multiple URLs and a file index with multiple files
+            url_suffix = f"_URL{url_index}" if url_count > 1 else ""
+            multi_file = len(unique_audio_urls) > 1
+            
+            # Download files for this URL
+            futures = []
+            for i, (audio_url, format_type) in enumerate(unique_audio_urls):
+                file_suffix = f"_{i+1}" if multi_file else ""
+                filepath = os.path.join(output_dir, f"{base_title}{url_suffix}{file_suffix}.{format_type}")
+                label = f"[URL {url_index}: {i+1}/{len(unique_audio_urls)}]"
+                futures.append(download_executor.submit(
+                    self._download_one, audio_url, format_type, filepath, url,
+                    download_headers, label))
+            
+            self.update_progress(f"URL {url_index}/{url_count}: 파일 {len(unique_audio_urls)}개 다운로드 중...")
+            
+            url_success_count = 0
+            url_file_count = 0
+            for future in as_completed(futures):
+                # Check for stop signal; don't start the files still waiting
+                if self.stop_event.is_set():
+                    for pending in futures:
+                        pending.cancel()
+                if future.cancelled():
+                    continue
+                
+                if future.result():
+                    url_success_count += 1
+                url_file_count += 1
+                
+                # One progress update per finished file
+                self.update_progress(f"URL {url_index}/{url_count}: 파일 {url_file_count}/{len(unique_audio_urls)}개 완료")
+            
+            # Summary for this URL (skipped when the user stopped)
+            if not self.stop_event.is_set():
+                log(f"📊 URL {url_index} 완료: {url_success_count}/{len(unique_audio_urls)}개 파일 성공")
+                log("")
+            return url_success_count, url_file_count
+            
+        except Exception as e:
+            # Handle any unexpected errors for this URL
+            log(f"✗ URL {url_index} 처리 중 오류: {str(e)}")
+            log(f"❌ URL {url_index} 건너뛰기")
+            log("")
+            return 0, 0
+    
+    def _download_one(self, audio_url: str, format_type: str, filepath: str,
+                      page_url: str, download_headers: dict, label: str) -> bool:
+        """Download one file, falling back to the alternative methods on failure."""
+        filename = os.path.basename(filepath)
+        self.log_message(f"{label} {format_type.upper()} 다운로드 시작: {filename}")
+        
+        methods = (
+            # Method 1: Standard download
+            ("기본 방법", lambda: self.download_file_gui(audio_url, filepath, page_url, download_headers)),
+            # Method 2: Alternative download
+            ("대안 방법", lambda: self.download_file_alternative_gui(audio_url, filepath, page_url)),
+            # Method 3: Browser simulation
+            ("브라우저 시뮬레이션", lambda: self.download_file_browser_sim_gui(audio_url, filepath, page_url)),
+        )
+        
+        # Start with whichever method worked last
+        order = self._method_order
+        for attempt, method_index in enumerate(order):
+            # Check for stop signal
+            if attempt and self.stop_event.is_set():
+                return False
+            
+            method_name, method = methods[method_index]
+            if method():
+                self.log_message(f"✓ {method_name}: {format_type.upper()} 다운로드 완료!")
+                with self._method_order_lock:
+                    if method_index != self._method_order[0]:
+                        self._method_order = (method_index,) + tuple(
+                            i for i in self._method_order if i != method_index)
+                return True
             
-            # Reset stop flag
-            self.stop_download = False
+            if attempt < len(order) - 1:
+                self.log_message(f"{method_name} 실패, 다음 방법 시도 중...")
+        
+        self.log_message(f"✗ 모든 방법으로 {format_type.upper()} 다운로드 실패")
+        return False
+    
+    def _finish_download(self) -> None:
+        """Reset the UI after the download thread has finished."""
+        # Re-enable buttons
+        self.download_btn.config(state='normal')
+        self.stop_btn.config(state='disabled')
+        self.is_downloading = False
+        
+        # Reset download button text
+        self.download_btn.config(text="🚀 다운로드 시작")
+        
+        # Empty the progress bar
+        self.progress_bar['value'] = 0
+        
+        # Update status to ready if not stopped by user
+        if not self.stop_event.is_set():
+            self.progress_var.set("대기 중...")
+            self.status_var.set("준비됨")
+        else:
+            self.progress_var.set("중단됨")
+            self.status_var.set("사용자 중단")
+        
+        # Reset stop flag
+        self.stop_event.clear()
             
-    def download_file_gui(self, url: str, filename: str, page_url: str) -> bool:
+    def _withdraw_progress(self, total_size: int, reported: int) -> None:
+        """Take an unfinished file's bytes back out of the overall progress."""
+        self.download_queue.put(('bytes', -reported))
+        self.download_queue.put(('bytes_total', -total_size))
+        
+    def download_file_gui(self, url: str, filename: str, page_url: str,
+                          download_headers: Optional[dict] = None) -> bool:
         """GUI version of download_file with progress reporting."""
+        # Written under a temporary name and renamed into place when complete
+        part_filename = filename + '.part'
+        name = os.path.basename(filename)
+        total_size = 0
+        reported = 0
+        
         try:
-            import os
-            import requests
-            
             # Check for stop signal
-            if self.stop_download:
+            if self.stop_event.is_set():
                 return False
             
             # Check if file already exists
             if os.path.exists(filename):
-                self.log_message(f"파일이 이미 존재합니다: {os.path.basename(filename)}")
+                self.log_message(f"파일이 이미 존재합니다: {name}")
                 return True
             
-            self.log_message(f"다운로드 시작: {os.path.basename(filename)}")
+            # Prepare headers for file download (download_worker passes ones shared by the whole page)
+            if download_headers is None:
+                download_headers = self.downloader.get_random_headers()
+                if page_url:
+                    page_parts = urlsplit(page_url)
+                    download_headers['Referer'] = page_url
+                    download_headers['Origin'] = f"{page_parts.scheme}://{page_parts.netloc}"
             
-            # Prepare headers for file download
-            download_headers = self.downloader.get_random_headers()
-            if page_url:
-                download_headers['Referer'] = page_url
-                download_headers['Origin'] = '/'.join(page_url.split('/')[:3])
+            # Audio is already compressed, and byte ranges must refer to the file as stored
+            headers = {**download_headers, 'Accept-Encoding': 'identity'}
             
-            # Get file size for progress bar
+            # Resume after the bytes an earlier attempt left in the .part file
             try:
-                head_response = self.downloader.session.head(url, headers=download_headers, timeout=30)
-                total_size = int(head_response.headers.get('content-length', 0))
-            except:
-                total_size = 0
-            
-            # Set progress bar to determinate mode for actual progress
-            self.progress_bar.config(mode='determinate')
-            self.progress_bar['maximum'] = 100
+                offset = os.path.getsize(part_filename)
+            except OSError:
+                offset = 0
+            if offset:
+                headers['Range'] = f'bytes={offset}-'
+                self.log_message(f"다운로드 재개: {name} ({offset//1024//1024}MB부터)")
+            else:
+                self.log_message(f"다운로드 시작: {name}")
             
-            # Download with progress
-            response = self.downloader.session.get(url, headers=download_headers, stream=True, timeout=30)
+            # Download with progress (other header profiles are tried if the server refuses these);
+            # a new download first checks whether it can be fetched in ranges
+            response = self.downloader.request_download(url, page_url, headers, probe_ranges=not offset)
+            if offset and response.status_code == 416:
+                # The .part is no shorter than the file itself; start over
+                response.close()
+                os.remove(part_filename)
+                offset = 0
+                del headers['Range']
+                response = self.downloader.request_download(url, page_url, headers, probe_ranges=True)
             response.raise_for_status()
             
-            downloaded = 0
-            with open(filename, 'wb') as file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    # Check for stop signal
-                    if self.stop_download:
-                        if os.path.exists(filename):
-                            os.remove(filename)  # Remove partial file
+            # Append only if the server actually honoured the range
+            if response.status_code != 206:
+                offset = 0
+            
+            # Get the whole file's size for the progress bar (0 if the server doesn't send it)
+            total_size = self.downloader.file_size(response)
+            
+            # The progress bar shows the bytes of every running download together
+            self.download_queue.put(('bytes_total', total_size))
+            
+            downloaded = offset
+            last_update = time.monotonic()
+            progress_lock = threading.Lock()
+            
+            def report(size: int) -> None:
+                # Ranged downloads report from several threads at once
+                nonlocal downloaded, reported, last_update
+                with progress_lock:
+                    downloaded += size
+                    
+                    # Update progress, at most ~10 times a second
+                    now = time.monotonic()
+                    if now - last_update < _PROGRESS_INTERVAL:
+                        return
+                    last_update = now
+                    
+                    if total_size > 0:
+                        self.download_queue.put(('bytes', downloaded - reported))
+                        reported = downloaded
+                    else:
+                        self.update_progress(f"다운로드 중: {downloaded//1024//1024}MB")
+            
+            # Large files go over several connections at once when the server allows it
+            ranged = not offset and self.downloader.supports_ranges(response)
+            if ranged:
+                ranged = self.downloader.download_ranges(url, part_filename, total_size,
+                                                         response.request.headers, report)
+                if self.stop_event.is_set():
+                    self._withdraw_progress(total_size, reported)
+                    return False
+                if not ranged:
+                    # The server ignored Range after all; fetch it as one stream
+                    self.download_queue.put(('bytes', -reported))
+                    downloaded = reported = 0
+                    response = self.downloader.request_download(url, page_url, headers)
+                    response.raise_for_status()
+            
+            if not ranged:
+                with open(part_filename, 'ab' if offset else 'wb') as file:
+                    # Same copy as the CLI: disk writes on a background thread, and the
+                    # copy ends early once the stop button is pressed (a new file is
+                    # reserved in full up front)
+                    try:
+                        stream_to_file(response, file, report, self.stop_event,
+                                       reserve=0 if offset else total_size)
+                    except ValueError:
+                        # Stopped; the .part is kept to resume from
+                        self._withdraw_progress(total_size, reported)
                         return False
-                        
-                    if chunk:
-                        file.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        # Update progress
-                        if total_size > 0:
-                            progress_percent = (downloaded / total_size) * 100
-                            self.progress_bar['value'] = progress_percent
-                            self.update_progress(f"다운로드 중: {progress_percent:.1f}% ({downloaded//1024//1024}MB/{total_size//1024//1024}MB)")
-                        else:
-                            self.update_progress(f"다운로드 중: {downloaded//1024//1024}MB")
-                        
-                        self.root.update_idletasks()
-            
-            # Reset progress bar to indeterminate
-            self.progress_bar.config(mode='indeterminate')
-            self.log_message(f"✓ 다운로드 완료: {os.path.basename(filename)}")
+                    
+                    file.flush()
+                    os.fsync(file.fileno())
+            
+            # Only a complete file ever appears under the final name
+            os.replace(part_filename, filename)
+            
+            # Count the rest of the file (Content-Length may differ from the bytes decoded)
+            if total_size > 0:
+                self.download_queue.put(('bytes', total_size - reported))
+            self.log_message(f"✓ 다운로드 완료: {name}")
             return True
             
         except Exception as e:
-            # Reset progress bar to indeterminate
-            self.progress_bar.config(mode='indeterminate')
-            # Clean up partial file if it exists
-            if os.path.exists(filename):
-                try:
-                    os.remove(filename)
-                except:
-                    pass
+            self._withdraw_progress(total_size, reported)
+            # A streamed .part is kept for the next attempt (download_ranges removes a ranged one)
             self.log_message(f"다운로드 오류: {str(e)}")
             return False
             
@@ -836,11 +1022,15 @@ class AudioDownloaderGUI:
     def on_closing(self) -> None:
         """Handle window closing."""
         if self.is_downloading:
-            if messagebox.askokcancel("종료", "다운로드가 진행 중입니다. 정말 종료하시겠습니까?"):
-                self.stop_download = True
-                self.root.destroy()
-        else:
-            self.root.destroy()
+            if not messagebox.askokcancel("종료", "다운로드가 진행 중입니다. 정말 종료하시겠습니까?"):
+                return
+        
+        # The pool threads aren't daemons, so the process only exits once running tasks
+        # return: the stop flag ends their transfers, and queued work is dropped
+        self.stop_event.set()
+        for executor in (self._run_executor, self._page_executor, self._download_executor):
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
             
     def run(self) -> None:
         """Start the GUI application."""
@@ -848,30 +1038,39 @@ class AudioDownloaderGUI:
         self.log_message("URL을 입력하고 다운로드 버튼을 클릭하세요.")
         self.log_message("")
         
-        # Check clipboard for URL automatically
-        try:
-            clipboard = self.root.clipboard_get()
-            if clipboard and clipboard.startswith(('http://', 'https://')):
-                # Check if URL text area is empty
-                current_text = self.url_text.get(1.0, tk.END).strip()
-                if not current_text:
-                    self.url_text.insert(tk.END, clipboard.strip() + "\n")
-                    self.log_message(f"📋 클립보드에서 URL 자동 감지: {clipboard[:50]}...")
-                else:
-                    self.log_message(f"📋 클립보드에 URL이 있습니다: {clipboard[:50]}... (Paste 버튼으로 추가 가능)")
-                # Do NOT auto-start download - just set the URL
-        except Exception:
-            pass  # Ignore clipboard errors
+        # Check clipboard for URL once the window is up (reading it can stall on X11)
+        self.root.after(50, self._scan_clipboard)
         
         # Focus on URL entry
         self.url_text.focus()
         
         # Start main loop
         self.root.mainloop()
+        
+    def _scan_clipboard(self) -> None:
+        """Put a URL found on the clipboard into the empty URL field."""
+        try:
+            clipboard = self.root.clipboard_get()
+        except tk.TclError:
+            return  # Empty clipboard or no text on it
+        
+        if clipboard.startswith(_HTTP_PREFIXES):
+            # Check if URL text area is empty
+            current_text = self.url_text.get(1.0, tk.END).strip()
+            if not current_text:
+                self.url_text.insert(tk.END, clipboard.strip() + "\n")
+                self.log_message(f"📋 클립보드에서 URL 자동 감지: {clipboard[:50]}...")
+            else:
+                self.log_message(f"📋 클립보드에 URL이 있습니다: {clipboard[:50]}... (Paste 버튼으로 추가 가능)")
+            # Do NOT auto-start download - just set the URL
 
 
 def main() -> None:
     """Main function to run the GUI application."""
+    # Keep the downloader's progress messages on the console as before
+    logging.basicConfig(format='%(message)s')
+    logging.getLogger('audio_downloader').setLevel(logging.INFO)
+    
     try:
         app = AudioDownloaderGUI()
         app.run()